@@ -116,9 +116,16 @@ class Age(Physics):
 		"""
 		print_text("::: solving age :::", cls=self)
 
-		# Solve!
+		# Solve!  the tensors persist across calls so the sparsity pattern
+		# built on the first assembly is re-used when the velocity changes
+		# between iterations :
 		#solve(lhs(self.F) == rhs(self.F), model.age, self.bc_age)
-		solve(self.a == self.L, self.age, self.bc_age, annotate=annotate)
+		if not hasattr(self, 'age_A'):
+			self.age_A = Matrix()
+			self.age_b = Vector()
+		assemble_system(self.a, self.L, self.bc_age,
+		                A_tensor=self.age_A, b_tensor=self.age_b)
+		solve(self.age_A, self.age.vector(), self.age_b, annotate=annotate)
 		self.model.age.interpolate(self.age)
 		print_min_max(self.model.age, 'age')
 
@@ -5,7 +5,6 @@ from cslvr.physics     import Physics
 from cslvr.d2model     import D2Model
 from cslvr.inputoutput import get_text, print_text, print_min_max
 import numpy               as np
-import matplotlib.pyplot   as plt
 import sys
 import os
 
@@ -247,46 +246,50 @@ class BalanceVelocity(Physics):
 		H      = S - B
 		N      = model.N
 		phi    = TestFunction(Q)
-		d_x    = TrialFunction(Q)
-		d_y    = TrialFunction(Q)
+		d_s    = TrialFunction(Q)
 		kappa  = Constant(self.kappa)
 		dOmega = model.dOmega()
 		dGamma = model.dGamma()
 
-		# horizontally smoothed direction of flow :
-		a_dSdx = + d_x * phi * dOmega \
-		         + (kappa*H)**2 * dot(grad(phi), grad(d_x)) * dOmega \
-		         - (kappa*H)**2 * dot(grad(d_x), N) * phi * dGamma
+		# horizontally smoothed direction of flow -- the same operator acts on
+		# both components, so it is assembled and factored only once and each
+		# component costs one right-hand-side assembly and a back-substitution :
+		a_dSd  = + d_s * phi * dOmega \
+		         + (kappa*H)**2 * dot(grad(phi), grad(d_s)) * dOmega \
+		         - (kappa*H)**2 * dot(grad(d_s), N) * phi * dGamma
 		L_dSdx = d[0] * phi * dOmega
+		L_dSdy = d[1] * phi * dOmega
 
-		a_dSdy = + d_y * phi * dOmega \
-		         + (kappa*H)**2 * dot(grad(phi), grad(d_y)) * dOmega \
-		         - (kappa*H)**2 * dot(grad(d_y), N) * phi * dGamma
-		L_dSdy = d[1] * phi*dOmega
+		A      = assemble(a_dSd)
+		solver = LUSolver(A)
 
 		# update velocity direction :
 		s    = "::: solving for smoothed x-component of flow direction " + \
 		       "with kappa = %g :::" % self.kappa
 		print_text(s, cls=self)
-		solve(a_dSdx == L_dSdx, model.d_x, annotate=annotate)
-		      #solver_parameters=self.linear_solve_params(), annotate=annotate)
+		solver.solve(model.d_x.vector(), assemble(L_dSdx), annotate=annotate)
 		print_min_max(model.d_x, 'd_x')
 
 		s    = "::: solving for smoothed y-component of flow direction " + \
 		       "with kappa = %g :::" % self.kappa
 		print_text(s, cls=self)
-		solve(a_dSdy == L_dSdy, model.d_y, annotate=annotate)
-		      #solver_parameters=self.linear_solve_params(), annotate=annotate)
+		solver.solve(model.d_y.vector(), assemble(L_dSdy), annotate=annotate)
 		print_min_max(model.d_y, 'd_y')
 
 		# normalize the direction vector :
 		s    =  r"::: normalizing flow direction :::"
 		print_text(s, cls=self)
-		d_x_v = model.d_x.vector().get_local()
-		d_y_v = model.d_y.vector().get_local()
-		d_n_v = np.sqrt(d_x_v**2 + d_y_v**2 + DOLFIN_EPS)
-		model.assign_variable(model.uhat, d_x_v / d_n_v)
-		model.assign_variable(model.vhat, d_y_v / d_n_v)
+		# np.hypot avoids the squared temporaries and the components divide by
+		# the norm in place, so the whole normalization allocates just the
+		# norm vector :
+		d_x_v  = model.d_x.vector().get_local()
+		d_y_v  = model.d_y.vector().get_local()
+		d_n_v  = np.hypot(d_x_v, d_y_v)
+		d_n_v += DOLFIN_EPS
+		d_x_v /= d_n_v
+		d_y_v /= d_n_v
+		model.assign_variable(model.uhat, d_x_v)
+		model.assign_variable(model.vhat, d_y_v)
 
 	def linear_solve_params(self):
 		"""
@@ -311,12 +314,12 @@ class BalanceVelocity(Physics):
 		"""
 		"""
 		model       = self.model
-		Uvn_a       = self.Uvnorm.vector().array()
+		Uvn_a       = self.Uvnorm.vector().get_local()
 		gub         = project(grad(model.Ubar), model.V)
 		tnorm_a     = model.get_norm(gub, 'l2')
-		H_a         = (model.S.vector().array() - model.B.vector().array())
-		uhat_a      = model.uhat.vector().array()
-		vhat_a      = model.vhat.vector().array()
+		H_a         = (model.S.vector().get_local() - model.B.vector().get_local())
+		uhat_a      = model.uhat.vector().get_local()
+		vhat_a      = model.vhat.vector().get_local()
 
 		uv_a     = H_a * (uhat_a*gu[0] + vhat_a*gu[1]) * gub[0] / tnorm_a
 		vv_a     = H_a * (uhat_a*gu[0] + vhat_a*gu[1]) * gub[1] / tnorm_a
@@ -352,11 +355,14 @@ class BalanceVelocity(Physics):
 			j_xn, j_yn, ubarn = self.U_s
 			jn = as_vector([j_xn, j_yn])
 			print_min_max(ubarn, 'ubarn')
-			ubarn    = project(ubarn, model.Q, annotate=annotate)
-			ubarn    = project(sqrt(dot(grad(ubarn), grad(ubarn)) + DOLFIN_EPS),
-			                   model.Q, annotate=annotate)
-			j_xn = project(j_xn, model.Q)
-			j_yn = project(j_yn, model.Q)
+			# these all target model.Q, so they share the cached factorization
+			# of its mass matrix :
+			ubarn    = model.cached_projection(ubarn, annotate=annotate)
+			ubarn    = model.cached_projection( \
+			             sqrt(dot(grad(ubarn), grad(ubarn)) + DOLFIN_EPS),
+			             annotate=annotate)
+			j_xn = model.cached_projection(j_xn)
+			j_yn = model.cached_projection(j_yn)
 			#ubarn = project(sqrt(dot(grad(ubarn), grad(ubarn))), model.Q)
 			model.assign_variable(model.Ubar, ubarn)
 			model.u_x.assign(j_xn)
@@ -365,17 +371,23 @@ class BalanceVelocity(Physics):
 			Ubar = Function(model.DG1)
 			solve(self.a == self.L, Ubar,
 			      solver_parameters=params, annotate=annotate)
-			Ubarn = project(Ubar, model.Q)
+			Ubarn = model.cached_projection(Ubar)
 			model.Ubar.assign(Ubarn)
 		else:
-			solve(self.a == self.L, model.Ubar,
-			      solver_parameters=params, annotate=annotate)
+			# the variational problem and its solver are constructed once and
+			# re-used, so repeated calls skip the form re-wrapping and solver
+			# setup of the high-level solve() :
+			if not hasattr(self, 'var_solver'):
+				problem = LinearVariationalProblem(self.a, self.L, model.Ubar)
+				self.var_solver = LinearVariationalSolver(problem)
+				self.var_solver.parameters['linear_solver'] = 'mumps'
+			self.var_solver.solve(annotate=annotate)
 		print_min_max(model.Ubar, 'Ubar')
 
 		## enforce positivity of balance-velocity :
 		#s    = "::: removing negative values of balance velocity :::"
 		#print_text(s, cls=self)
-		#Ubar_v = model.Ubar.vector().array()
+		#Ubar_v = model.Ubar.vector().get_local()
 		#Ubar_v[Ubar_v < 0] = 0
 		#model.assign_variable(model.Ubar, Ubar_v)
 
@@ -404,7 +404,7 @@ class D1Model(Model):
 
 		# calculate the new height of original surface by interpolating the
 		# vertical speed from w and keeping the ratio intact :
-		wp      = self.w.vector().array()
+		wp      = self.w.vector().get_local()
 		interp  = interp1d(self.z, wp, bounds_error=False, fill_value=wp[0])
 		wzo     = interp(self.zo)
 		dt      = self.time_step(0)
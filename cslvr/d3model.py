@@ -7,7 +7,6 @@ from cslvr.helper      import Boundary
 from scipy.spatial     import cKDTree
 from copy              import copy
 import numpy               as np
-import matplotlib.pyplot   as plt
 import sys, os
 
 class D3Model(Model):
@@ -666,6 +665,9 @@ class D3Model(Model):
 		# mark the exterior facets and interior cells appropriately :
 		self.calculate_boundaries()
 
+		# the mesh has moved -- refresh the cell-diameter coefficient :
+		self.update_cell_diameter()
+
 	def calc_thickness(self):
 		"""
 		Calculate the continuous thickness field which increases from 0 at the
@@ -713,10 +715,6 @@ class D3Model(Model):
 			Q  = self.Q_non_periodic
 			#Q = u.function_space()
 		ff   = self.ff
-		phi  = TestFunction(Q)
-		v    = TrialFunction(Q)
-		a    = v.dx(2) * phi * dx
-		L    = DOLFIN_EPS * phi * dx
 		bcs  = []
 		# extrude bed (ff = 3,5)
 		if d == 'up':
@@ -739,8 +737,36 @@ class D3Model(Model):
 		except AttributeError:
 			name = 'extruded'
 		v    = Function(Q, name=name)
-		solve(a == L, v, bcs, annotate=annotate,
-		      solver_parameters=self.linear_solve_params())
+		if annotate:
+			# dolfin-adjoint must tape the full variational solve :
+			phi  = TestFunction(Q)
+			dv   = TrialFunction(Q)
+			a    = dv.dx(2) * phi * dx
+			L    = DOLFIN_EPS * phi * dx
+			solve(a == L, v, bcs, annotate=annotate,
+			      solver_parameters=self.linear_solve_params())
+		else:
+			# neither the operator nor the unconstrained right-hand side
+			# depends on u, so factor once per (direction, space) pair; every
+			# extrusion afterwards costs only an application of the boundary
+			# values and a back-substitution :
+			key = (d, Q.id())
+			if not hasattr(self, 'vert_extrude_cache'):
+				self.vert_extrude_cache = {}
+			if key not in self.vert_extrude_cache:
+				phi    = TestFunction(Q)
+				dv     = TrialFunction(Q)
+				A      = assemble(dv.dx(2) * phi * dx)
+				b      = assemble(DOLFIN_EPS * phi * dx)
+				for bc in bcs:
+					bc.apply(A)
+				solver = LUSolver(A)
+				self.vert_extrude_cache[key] = (solver, b)
+			solver, b_0 = self.vert_extrude_cache[key]
+			b = b_0.copy()
+			for bc in bcs:
+				bc.apply(b)
+			solver.solve(v.vector(), b, annotate=annotate)
 		print_min_max(v, 'extruded function')
 		return v
 
@@ -756,7 +782,7 @@ class D3Model(Model):
 			#Q = u.function_space()
 		ff  = self.ff
 		phi = TestFunction(Q)
-		v   = TrialFunction(Q)
+		dv  = TrialFunction(Q)
 		bcs = []
 		# integral is zero on bed (ff = 3,5)
 		if d == 'up':
@@ -764,7 +790,7 @@ class D3Model(Model):
 				bcs.append(DirichletBC(Q, 0.0, ff, self.GAMMA_B_GND))  # grounded
 			if self.N_GAMMA_B_FLT != 0:
 				bcs.append(DirichletBC(Q, 0.0, ff, self.GAMMA_B_FLT))  # shelves
-			a      = v.dx(2) * phi * dx
+			a      = dv.dx(2) * phi * dx
 		# integral is zero on surface (ff = 2,6)
 		elif d == 'down':
 			if self.N_GAMMA_S_GND != 0:
@@ -775,12 +801,32 @@ class D3Model(Model):
 				bcs.append(DirichletBC(Q, 0.0, ff, self.GAMMA_U_GND))  # grounded
 			if self.N_GAMMA_U_FLT != 0:
 				bcs.append(DirichletBC(Q, 0.0, ff, self.GAMMA_U_FLT))  # shelves
-			a      = -v.dx(2) * phi * dx
+			a      = -dv.dx(2) * phi * dx
 		L      = u * phi * dx
 		name   = 'value integrated %s' % d
 		v      = Function(Q, name=name)
-		solve(a == L, v, bcs, annotate=annotate,
-		      solver_parameters=self.linear_solve_params())
+		if annotate:
+			# dolfin-adjoint must tape the full variational solve :
+			solve(a == L, v, bcs, annotate=annotate,
+			      solver_parameters=self.linear_solve_params())
+		else:
+			# the operator depends only on the direction and space -- factor
+			# once per pair, then each integration costs a right-hand-side
+			# assembly and a back-substitution :
+			key = (d, Q.id())
+			if not hasattr(self, 'vert_integrate_cache'):
+				self.vert_integrate_cache = {}
+			if key not in self.vert_integrate_cache:
+				A      = assemble(a)
+				for bc in bcs:
+					bc.apply(A)
+				solver = LUSolver(A)
+				self.vert_integrate_cache[key] = solver
+			solver = self.vert_integrate_cache[key]
+			b      = assemble(L)
+			for bc in bcs:
+				bc.apply(b)
+			solver.solve(v.vector(), b, annotate=annotate)
 		print_min_max(v, 'vertically integrated function')
 		return v
 
@@ -854,11 +900,11 @@ class D3Model(Model):
 		s = "::: initializing 3D variables :::"
 		print_text(s, cls=self)
 
-		# Depth below sea level :
-		class Depth(Expression):
-			def eval(self, values, x):
-				values[0] = -min(0, x[2])
-		self.D = Depth(element=self.Q.ufl_element())
+		# Depth below sea level.  A UFL conditional is inlined directly into
+		# every generated kernel that integrates it, where an Expression costs
+		# a virtual evaluation call at each quadrature point :
+		x      = SpatialCoordinate(self.mesh)
+		self.D = conditional(lt(x[2], 0.0), -x[2], 0.0)
 
 		# only need one flat-mesh variable in order to transfer data between the
 		# 3D mesh and 2D mesh :
@@ -17,6 +17,33 @@ import sys
 import os
 import json
 
+try:
+	from numba              import njit, prange
+except ImportError:
+	njit = None
+
+if njit is not None:
+	@njit(parallel=True, cache=True)
+	def _partition_energy_kernel(theta, theta_melt, T_melt, L_f, T_w,
+	                             T, Tp, W):
+		"""
+		Fused per-dof partition of energy ``theta`` into temperature ``T``,
+		pressure-adjusted temperature ``Tp``, and water content ``W``; one
+		compiled sweep over the dof vector in place of several NumPy
+		temporaries.
+		"""
+		for i in prange(theta.shape[0]):
+			T_n   = (-146.3 + np.sqrt(146.3**2 + 2*7.253*theta[i])) / 7.253
+			Tp[i] = T_n if T_n < T_w else T_w
+			if theta[i] >= theta_melt[i]:
+				T[i] = T_melt[i]
+			else:
+				T[i] = T_n
+			w = (theta[i] - theta_melt[i]) / L_f
+			if   w < 0.0: w = 0.0
+			elif w > 1.0: w = 1.0
+			W[i] = w
+
 
 
 
@@ -259,11 +286,14 @@ class Energy(Physics):
 		"""
 		Retuns the internal friction heat; the strain heating.
 		"""
-		# collect the velocity vector to be of the same dimension os the model :
-		u      = self.momentum.get_velocity()
-		epsdot = self.momentum.effective_strain_rate(u) + self.model.eps_reg
-		eta    = self.momentum.get_viscosity(u)
-		return 4 * eta * epsdot
+		# express the heating in powers of the momentum's shared strain-rate
+		# base :math:`4 \\eta \\dot{\\varepsilon}_e = 2 A^{-1/n} s^{n+1}`, so
+		# the fractional power of the invariant and the rate-factor
+		# conditionals are generated only once :
+		n   = self.model.n
+		s_b = self.momentum.get_strain_rate_base()
+		A_c = self.momentum.get_rate_factor_coef()
+		return 2 * A_c * s_b**(n+1)
 
 	def get_external_friction_heat(self):
 		r"""
@@ -289,7 +319,8 @@ class Energy(Physics):
 		"""
 		Returns a set of default solver parameters that yield good performance
 		"""
-		params  = {'solver'              : 'mumps',
+		params  = {'solver'              : {'linear_solver'  : 'gmres',
+		                                    'preconditioner' : 'hypre_amg'},
 		           'use_surface_climate' : False}
 		return params
 
@@ -432,32 +463,40 @@ class Energy(Physics):
 		model    = self.model
 		T_w      = model.T_w(0)
 
-		# temperature is a quadradic function of energy :
-		theta_v  = model.theta.vector().get_local()
-		T_n_v    = (-146.3 + np.sqrt(146.3**2 + 2*7.253*theta_v)) / 7.253
-		T_v      = T_n_v.copy()
-		Tp_v     = T_n_v.copy()
+		theta_v      = model.theta.vector().get_local()
+		T_melt_v     = model.T_melt.vector().get_local()
+		theta_melt_v = model.theta_melt.vector().get_local()
+
+		if njit is not None:
+			# one fused compiled sweep yields all three fields at once :
+			T_v  = np.empty_like(theta_v)
+			Tp_v = np.empty_like(theta_v)
+			W_v  = np.empty_like(theta_v)
+			_partition_energy_kernel(theta_v, theta_melt_v, T_melt_v,
+			                         model.L_f(0), T_w, T_v, Tp_v, W_v)
+		else:
+			# temperature is a quadradic function of energy :
+			T_n_v = (-146.3 + np.sqrt(146.3**2 + 2*7.253*theta_v)) / 7.253
+
+			# the cap at the triple point is a single branchless pass rather
+			# than a masked store :
+			Tp_v  = np.minimum(T_n_v, T_w)
+
+			# correct for the pressure-melting point :
+			T_v   = np.where(theta_v >= theta_melt_v, T_melt_v, T_n_v)
+
+			# water content solved diagnostically -- no water where frozen and
+			# no hot water, please -- clipped in place :
+			W_v   = (theta_v - theta_melt_v) / model.L_f(0)
+			np.clip(W_v, 0.0, 1.0, out=W_v)
 
 		# create pressure-adjusted temperature for rate-factor :
-		Tp_v[Tp_v > T_w] = T_w
 		model.init_Tp(Tp_v)
-
-		# correct for the pressure-melting point :
-		T_melt_v     = model.T_melt.vector().get_local()
-		theta_melt_v = model.theta_melt.vector().get_local()
-		warm         = theta_v >= theta_melt_v
-		cold         = theta_v <  theta_melt_v
-		T_v[warm]    = T_melt_v[warm]
 		model.init_T(T_v)
 
-		# water content solved diagnostically :
+		# update water content :
 		s = "::: calculating water content :::"
 		print_text(s, cls=self)
-		W_v  = (theta_v - theta_melt_v) / model.L_f(0)
-
-		# update water content :
-		W_v[W_v < 0.0]  = 0.0    # no water where frozen, please.
-		W_v[W_v > 1.0]  = 1.0    # no hot water, please.
 		model.assign_variable(model.W0,  model.W)
 		model.init_W(W_v)
 
@@ -664,9 +703,13 @@ class Energy(Physics):
 		# calculate bulk density :
 		s = "::: calculating bulk density :::"
 		print_text(s, cls=self)
-		model       = self.model
-		rhob        = project(self.rho, annotate=False)
-		model.assign_variable(model.rhob, rhob)
+		model   = self.model
+
+		# the mixture density is affine in the water content, so it may be
+		# evaluated directly on the dof vector rather than projected :
+		W_v     = model.W.vector().get_local()
+		rhob_v  = (1 - W_v)*model.rho_i(0) + W_v*model.rho_w(0)
+		model.assign_variable(model.rhob, rhob_v)
 
 
 
@@ -801,8 +844,14 @@ class Enthalpy(Energy):
 			xi    =     ((3 + 3*Pe*xi_1)*tanh(Pe) - (3*Pe + Pe**2*xi_1)) \
 				       /  ((2 - 3*xi_1*tanh(Pe))*Pe**2)
 
-		# intrinsic time parameter :
-		tau     = h*xi / (2 * ut_norm)
+		# intrinsic time parameter -- evaluated into a cellwise-constant
+		# coefficient once per solve, so the square roots, hyperbolic
+		# tangents, and divisions above are computed once per cell rather
+		# than at every quadrature point of every stabilized integral :
+		self.tau_expr = h*xi / (2 * ut_norm)
+		self.tau      = Function(FunctionSpace(model.mesh, 'DG', 0),
+		                         name='energy.tau')
+		tau     = self.tau
 		psihat  = psi + tau * dot(ut, grad(psi))
 
 		# the linear differential operator for this problem :
@@ -922,7 +971,7 @@ class Enthalpy(Energy):
 
 		Pe          = self.get_grid_peclet_number()
 		if avg:  Pe = self.model.calc_vert_average(Pe, annotatate=annotate)
-		else:    Pe = project(Pe, solver_type='iterative', annotate=annotate)
+		else:    Pe = self.model.cached_projection(Pe, annotate=annotate)
 		self.model.assign_variable(self.model.Pe, Pe, annotate=annotate)
 
 	def calc_vert_avg_W(self):
@@ -1033,10 +1082,10 @@ class Enthalpy(Energy):
 		print_text(s, cls=self)
 
 		# TODO: the operation below breaks dolfin-adjoint annotation.
-		W_v              = self.model.W.vector().get_local()
-		alpha_v          = self.model.alpha.vector().get_local()
-		alpha_v[:]       = 0
-		alpha_v[W_v > 0] = 1
+		# the marker is formed branchlessly in a single pass over the dof
+		# vector rather than through a masked store :
+		W_v     = self.model.W.vector().get_local()
+		alpha_v = (W_v > 0).astype(np.float64)
 		self.model.init_alpha(alpha_v)
 
 	def calc_basal_temperature_flux(self, annotate=False):
@@ -1049,7 +1098,7 @@ class Enthalpy(Energy):
 
 		n_b     = self.model.n_b
 		q       = self.get_temperature_flux_vector()
-		q_dot_n = project(dot(q, n_b), self.model.Q, annotate=annotate)
+		q_dot_n = self.model.cached_projection(dot(q, n_b), annotate=annotate)
 		self.model.assign_variable(self.model.gradT_B, q_dot_n, annotate=annotate)
 		print_min_max(self.model.gradT_B, 'gradT_B')
 
@@ -1063,7 +1112,7 @@ class Enthalpy(Energy):
 
 		n_b     = self.model.n_b
 		q       = self.get_temperature_melting_flux_vector()
-		q_dot_n = project(dot(q, n_b), self.model.Q, annotate=annotate)
+		q_dot_n = self.model.cached_projection(dot(q, n_b), annotate=annotate)
 		self.model.assign_variable(self.model.gradTm_B, q_dot_n, annotate=annotate)
 		print_min_max(self.model.gradTm_B, 'gradTm_B')
 
@@ -1075,8 +1124,8 @@ class Enthalpy(Energy):
 		s = "::: solving basal-melt-rate :::"
 		print_text(s, cls=self)
 
-		M_b = project(self.get_basal_melting_rate(), self.model.Q, \
-		              annotate=annotate)
+		M_b = self.model.cached_projection(self.get_basal_melting_rate(), \
+		                                   annotate=annotate)
 		self.model.assign_variable(self.model.Mb, M_b, annotate=annotate)
 
 	def calc_q_fric(self):
@@ -1087,8 +1136,8 @@ class Enthalpy(Energy):
 		s = "::: solving basal friction heat :::"
 		print_text(s, cls=self)
 
-		q_fric = project(self.get_external_friction_heat(), self.model.Q, \
-		                 annotate=annotate)
+		q_fric = self.model.cached_projection(self.get_external_friction_heat(), \
+		                                      annotate=annotate)
 		self.model.assign_variable(self.model.q_fric, q_fric, annotate=annotate)
 
 	def derive_temperate_zone(self, annotate=False):
@@ -1116,6 +1165,7 @@ class Enthalpy(Energy):
 			self.set_basal_flux_mode('temperate_zone_mark')
 
 		# solve the linear system :
+		self.update_stabilization_parameter()
 		solve(self.get_lhs() == self.get_rhs(), self.get_unknown(),
 		      self.get_boundary_conditions(),
 		      solver_parameters = self.solve_params['solver'], annotate=annotate)
@@ -1125,13 +1175,11 @@ class Enthalpy(Energy):
 		theta_v         = self.get_unknown().vector().get_local()
 		theta_melt_v    = model.theta_melt.vector().get_local()
 		W_v             = (theta_v - theta_melt_v) / model.L_f(0)
-		W_v[W_v < 0.0]  = 0.0    # no water where frozen, please.
+		np.maximum(W_v, 0.0, out=W_v)   # no water where frozen, please.
 
 		# mark appropriately basal regions with an overlying temperate layer :
 		# TODO: the operation below breaks dolfin-adjoint annotation.
-		alpha_v          = model.alpha.vector().get_local()
-		alpha_v[:]       = 0
-		alpha_v[W_v > 0] = 1
+		alpha_v = (W_v > 0).astype(np.float64)
 		model.init_alpha(alpha_v)
 
 		# reset to previous energy flux mode, if necessary :
@@ -1181,6 +1229,7 @@ class Enthalpy(Energy):
 		while abs_error > atol and rel_error > rtol and counter <= max_iter:
 
 			# solve the linear system :
+			self.update_stabilization_parameter()
 			solve(self.get_lhs() == self.get_rhs(), self.get_unknown(),
 			      self.get_boundary_conditions(),
 			      solver_parameters = self.solve_params['solver'], annotate=annotate)
@@ -1229,6 +1278,21 @@ class Enthalpy(Energy):
 		if transient:
 			energy.make_transient(time_step = model.time_step)
 
+	def update_stabilization_parameter(self):
+		"""
+		Re-evaluate the cellwise-constant intrinsic-time parameter ``self.tau``
+		from the current velocity and thermal state.
+		"""
+		psi_0 = TestFunction(self.tau.function_space())
+		# the DG0 mass matrix is diagonal with the cell volumes, so the
+		# projection reduces to a single division :
+		if not hasattr(self, 'tau_cell_volume'):
+			self.tau_cell_volume = assemble(Constant(1.0)*psi_0*dx).get_local()
+		tau_v = assemble(self.tau_expr*psi_0*dx).get_local()
+		tau_v /= self.tau_cell_volume
+		self.tau.vector().set_local(tau_v)
+		self.tau.vector().apply('insert')
+
 	def solve(self, annotate=False):
 		"""
 		Solve the energy equations, saving energy to ``model.theta``, temperature
@@ -1239,6 +1303,9 @@ class Enthalpy(Energy):
 		# update the surface climate if desired :
 		if self.solve_params['use_surface_climate']:  self.solve_surface_climate()
 
+		# update the stabilization for the current velocity and thermal state :
+		self.update_stabilization_parameter()
+
 		# solve as defined in ``physics.Physics.solve()`` :
 		super(Energy, self).solve(annotate)
 
@@ -1365,9 +1432,6 @@ class EnergyHybrid(Energy):
 		def A_v(T):
 			return conditional(le(T,263.15),Bc*exp(-Qc/(Rc*T)),Bw*exp(-Qw/(Rc*T)))
 
-		def eta_v(s):
-			return A_v(T0.eval(s))**(-1./n)/2.*epsilon_dot(s)**((1.-n)/(2*n))
-
 		def w(s):
 			w_0 = (U[0].dx(0) + U[1].dx(1))*(s-1.)
 			w_2 = + (U[2].dx(0) + U[3].dx(1))*(s**(n+2) - s)/(n+1) \
@@ -1389,9 +1453,12 @@ class EnergyHybrid(Energy):
 			if transient:
 				w_eff += 1.0/H*(1.0 - s)*(H - H0)/dt
 
-			# STRAIN HEAT
-			#Phi_strain = (2*n)/(n+1)*2*eta_v(s)*epsilon_dot(s)
-			Phi_strain = 4*eta_v(s)*epsilon_dot(s)
+			# STRAIN HEAT; the invariant is shared between the viscosity and
+			# the heating so its fractional power is generated only once :
+			eps_s      = variable(epsilon_dot(s))
+			eta_s      = A_v(T0.eval(s))**(-1./n)/2.*eps_s**((1.-n)/(2*n))
+			#Phi_strain = (2*n)/(n+1)*2*eta_s*eps_s
+			Phi_strain = 4*eta_s*eps_s
 
 			# STABILIZATION SCHEME
 			#Umag   = sqrt(u(s)**2 + v(s)**2 + 1e-3)
@@ -1442,12 +1509,9 @@ class EnergyHybrid(Energy):
 		"""
 		Returns a set of default ffc options that yield good performance
 		"""
-		#ffc_options = {"optimize"               : True,
-		#               "eliminate_zeros"        : True,
-		#               "precompute_basis_const" : True,
-		#               "precompute_ip_const"    : True}
-		ffc_options = {"optimize"               : True}
-		return ffc_options
+		# use the tuned representation, quadrature degree, and compile flags
+		# shared by every physics :
+		return self.default_ffc_params()
 
 	def default_solve_params(self):
 		"""
@@ -62,16 +62,16 @@ class FirnPlot(object):
 		totb     = 100 + 10 * sum(blist)
 
 		# convert to arrays :
-		thetap  = model.theta.vector().array()
-		rhop    = model.rho.vector().array()
-		wp      = model.w.vector().array()
-		agep    = model.age.vector().array()
-		Tp      = model.T.vector().array()
-		Wp      = model.W.vector().array()
-		rp      = model.r.vector().array()
-		pp      = model.p.vector().array()
-		up      = model.u.vector().array()
-		Smip    = model.Smi.vector().array()
+		thetap  = model.theta.vector().get_local()
+		rhop    = model.rho.vector().get_local()
+		wp      = model.w.vector().get_local()
+		agep    = model.age.vector().get_local()
+		Tp      = model.T.vector().get_local()
+		Wp      = model.W.vector().get_local()
+		rp      = model.r.vector().get_local()
+		pp      = model.p.vector().get_local()
+		up      = model.u.vector().get_local()
+		Smip    = model.Smi.vector().get_local()
 		cp      = model.ci(0)
 		Ts      = thetap[0] / cp
 
@@ -86,7 +86,7 @@ class FirnPlot(object):
 		r      = rp * 1000
 		Ts     = Ts - 273.15
 		rhos   = rho[0]
-		S_ring = model.S_ring.vector().array()[0]
+		S_ring = model.S_ring.vector().get_local()[0]
 
 		# y-value :
 		z      = model.z
@@ -274,16 +274,16 @@ class FirnPlot(object):
 		index  = model.index
 
 		# convert to arrays :
-		thetap = model.theta.vector().array()
-		rhop   = model.rho.vector().array()
-		wp     = model.w.vector().array()
-		agep   = model.age.vector().array()
-		Tp     = model.T.vector().array()
-		Wp     = model.W.vector().array()
-		rp     = model.r.vector().array()
-		pp     = model.p.vector().array()
-		up     = model.u.vector().array()
-		Smip   = model.Smi.vector().array()
+		thetap = model.theta.vector().get_local()
+		rhop   = model.rho.vector().get_local()
+		wp     = model.w.vector().get_local()
+		agep   = model.age.vector().get_local()
+		Tp     = model.T.vector().get_local()
+		Wp     = model.W.vector().get_local()
+		rp     = model.r.vector().get_local()
+		pp     = model.p.vector().get_local()
+		up     = model.u.vector().get_local()
+		Smip   = model.Smi.vector().get_local()
 		cp     = model.ci(0)
 		Ts     = thetap[0] / cp
 		T_w    = model.T_w(0)
@@ -298,7 +298,7 @@ class FirnPlot(object):
 		Smi    = Smip
 		r      = rp * 1000
 		Ts     = Ts - T_w
-		S_ring = model.S_ring.vector().array()[0]
+		S_ring = model.S_ring.vector().get_local()[0]
 		t      = model.t / model.spy(0)
 		phi    = 1 - rho/917.0
 		Smi    = 0.0057 / (1 - phi) + 0.017
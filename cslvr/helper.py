@@ -43,13 +43,18 @@ class Boundary(object):
 		self.measure     = measure
 		self.description = description
 		self.markers     = markers
+		self.meas        = None
 	def __call__(self):
-		for i,m in enumerate(self.markers):
-			if i == 0:
-				meas  = self.measure(m)
-			else:
-				meas += self.measure(m)
-		return meas
+		# build the summed measure once; every physics instance then shares
+		# the identical UFL object and its compiled-form cache entry :
+		if self.meas is None:
+			for i,m in enumerate(self.markers):
+				if i == 0:
+					meas  = self.measure(m)
+				else:
+					meas += self.measure(m)
+			self.meas = meas
+		return self.meas
 
 
 
@@ -3,10 +3,15 @@ from __future__ import print_function
 from builtins import range
 from builtins import object
 from scipy.io          import loadmat
-from scipy.interpolate import RectBivariateSpline, griddata, interp2d, interp1d
+from scipy.interpolate import RectBivariateSpline, griddata, interp2d, \
+                              CloughTocher2DInterpolator, \
+                              LinearNDInterpolator, NearestNDInterpolator
+from scipy.ndimage     import map_coordinates
+from scipy.spatial     import Delaunay
 from numpy             import array, linspace, ones, isnan, all, zeros, shape, \
-                              ndarray, e, nan, float64, logical_and, where, \
-                              meshgrid, arange
+                              ndarray, e, nan, logical_and, where, \
+                              meshgrid, clip, tile, rint, \
+                              repeat, column_stack, compress, ascontiguousarray
 from dolfin            import interpolate, Expression, Function, \
                               vertices, FunctionSpace, RectangleMesh, \
                               MPI, mpi_comm_world, GenericVector, parameters, \
@@ -16,6 +21,21 @@ from pyproj            import Proj, transform
 from colored           import fg, attr
 import sys
 
+# use bottleneck's faster nan-reductions if it is available :
+try:
+	from bottleneck      import allnan
+except ImportError:
+	allnan = None
+
+# pyproj >= 2 provides a re-usable Transformer which skips re-building the
+# underlying PJ object on every call; fall back to the functional interface
+# on older versions :
+try:
+	from pyproj          import Transformer, CRS
+except ImportError:
+	Transformer = None
+	CRS         = None
+
 class DataInput(object):
 	"""
 	This class is used as a container for all geographical and geological data
@@ -51,6 +71,9 @@ class DataInput(object):
 		self.rem_nans   = False     # may change depending on 'identify_nans' call
 		self.chg_proj   = False     # change to other projection flag
 		self.color      = 'light_green'
+		self.spl_cache  = {}        # cache of interpolation objects
+		self.tri_cache  = {}        # cache of source-grid triangulations
+		self.trans_cache = {}       # cache of coordinate transformations
 
 		di              = di.copy()
 
@@ -77,8 +100,9 @@ class DataInput(object):
 		# process the data di :
 		for fn in di:
 
-			# raw data matrix with key fn :
-			d = di[fn]
+			# raw data matrix with key fn -- made C-contiguous once here so that
+			# later ravel() calls return views rather than copies :
+			d = ascontiguousarray(di[fn])
 
 			# identify, but not remove the NaNs :
 			self.__identify_nans(d, fn)
@@ -123,19 +147,17 @@ class DataInput(object):
 		xmin,ymin = self.proj(ur_lon, ur_lat)
 
 		# mark the areas we want to keep :
-		xlt = self.x < xmin
-		xgt = self.x > xmax
-		ylt = self.y < ymin
-		ygt = self.y > ymax
+		xmask = logical_and(self.x >= xmin, self.x <= xmax)
+		ymask = logical_and(self.y >= ymin, self.y <= ymax)
 
-		# take the union :
-		xs  = where(logical_and(xlt, xgt))[0]
-		ys  = where(logical_and(ylt, ygt))[0]
+		# the region kept is contiguous, so convert the masks to slices; the
+		# reduced data are then views of the originals rather than copies :
+		xs  = slice(xmask.argmax(), len(xmask) - xmask[::-1].argmax())
+		ys  = slice(ymask.argmax(), len(ymask) - ymask[::-1].argmax())
 
 		# cut out the parts we do not need :
 		for i in self.data:
-			self.data[i] = self.data[i][:,xs]
-			self.data[i] = self.data[i][ys,:]
+			self.data[i] = self.data[i][ys, xs]
 
 		# replace the statistics :
 		self.x     = self.x[xs]
@@ -147,6 +169,9 @@ class DataInput(object):
 		self.nx    = len(self.x)
 		self.ny    = len(self.y)
 
+		# the grid changed, so any cached interpolation objects are stale :
+		self.__invalidate_cache()
+
 	def change_projection(self, di):
 		"""
 		Changes the :class:`~pyproj.Proj` of this data to that of the
@@ -215,10 +240,16 @@ class DataInput(object):
 		    " %s interpolation :::"
 		print_text(s % (di.name, fi, self.name, fo, method), self.color)
 
-		# check if the projections are the same :
+		# check if the projections are the same.  Compare CRS semantics where
+		# pyproj provides them, since mere formatting differences between the
+		# proj strings would otherwise force the slow unstructured path :
+		if CRS is not None:
+			same_proj = CRS(self.proj.srs).equals(CRS(di.proj.srs))
+		else:
+			same_proj = self.proj.srs == di.proj.srs
 
 		# if they are, then use structured grid interpolation :
-		if self.proj.srs == di.proj.srs:
+		if same_proj:
 			s      = '    - projections match, using structured interpolation -'
 			print_text(s, self.color)
 
@@ -234,17 +265,28 @@ class DataInput(object):
 			         'interpolation -'
 			print_text(s, self.color)
 			xs,ys   = self.transform_xy(di)
-			di_pts  = (xs.flatten(), ys.flatten())
 			xr,yr   = meshgrid(self.x, self.y)
-			do_pts  = (xr,yr)
 
-			# create interpolation object to convert to bedmap2 coordinates :
-			# surface accumulation/ablation :
-			fo_v    = griddata(di_pts, di.data[fi].flatten(), do_pts,
-			                   method=method, fill_value=0.0)
-
-		# set the data to our dictionary :
+			# the Delaunay triangulation of the source grid dominates the cost of
+			# unstructured interpolation, so build it once per source object and
+			# re-use it for every field interpolated from ``di`` :
+			if id(di) not in self.tri_cache:
+				self.tri_cache[id(di)] = Delaunay(column_stack([xs, ys]))
+			tri     = self.tri_cache[id(di)]
+
+			vals    = di.data[fi].ravel()
+			if   order == 1:
+				interp = NearestNDInterpolator(tri.points, vals)
+			elif order == 2:
+				interp = LinearNDInterpolator(tri, vals, fill_value=0.0)
+			else:
+				interp = CloughTocher2DInterpolator(tri, vals, fill_value=0.0)
+			fo_v    = interp(xr, yr)
+
+		# set the data to our dictionary; any cached interpolation of this
+		# key is now stale :
 		self.data[fo] = fo_v
+		self.__invalidate_cache(fo)
 
 		print_min_max(di.data[fi], 'original %s    ' % fi)
 		print_min_max(fo_v,        'interpolated %s' % fo)
@@ -256,13 +298,15 @@ class DataInput(object):
 		by this :class:`~inputoutput.DataInput`'s.
 
 		:param di: the :class:`~inputoutput.DataInput` with projection coordinates to transform
-		:rtype: tuple of converted coordinates
+		:rtype: tuple of flat arrays of converted grid-point coordinates
 		"""
-		# FIXME : need a fast way to convert all the x, y. Currently broken
 		s = "::: transforming coordinates from %s to %s :::" % (di.name, self.name)
 		print_text(s, self.color)
-		vx,vy  = meshgrid(di.x, di.y)
-		xn, yn = transform(di.proj, self.proj, vx, vy)
+		# transform the entire flattened grid with one vectorized call, rather
+		# than materializing a pair of dense meshgrid arrays :
+		vx     = tile(di.x, di.ny)
+		vy     = repeat(di.y, di.nx)
+		xn, yn = self.__get_transform(di.proj, self.proj)(vx, vy)
 		print_text('    - done -', self.color)
 		return (xn, yn)
 
@@ -305,7 +349,9 @@ class DataInput(object):
 			amin = ( umin/(1.0 + U.min()) - umax/(1.0 + U.max()) ) / (umax - umin)
 			amax = umin / ( amin + 1.0/(1.0 + U.max()) )
 
+		# any cached interpolation of this key is now stale :
 		self.data[fn] = (amin + 1.0/(1.0 + U)) * amax
+		self.__invalidate_cache(fn)
 
 	def __identify_nans(self, data, fn):
 		"""
@@ -313,8 +359,19 @@ class DataInput(object):
 		happens when the data from multiple GIS databases don't quite align on
 		whatever the desired grid is.
 		"""
-		good_x = ~all(isnan(data), axis=0) & self.good_x  # good cols
-		good_y = ~all(isnan(data), axis=1) & self.good_y  # good rows
+		# most fields are clean; probe a small strided sample first, then
+		# confirm with one full scan, before paying for two axis reductions :
+		flat = data.ravel()
+		if not isnan(flat[::max(1, data.size // 4096)]).any() \
+		   and not isnan(data).any():
+			return
+
+		if allnan is not None:
+			good_x = ~allnan(data, axis=0) & self.good_x  # good cols
+			good_y = ~allnan(data, axis=1) & self.good_y  # good rows
+		else:
+			good_x = ~all(isnan(data), axis=0) & self.good_x  # good cols
+			good_y = ~all(isnan(data), axis=1) & self.good_y  # good rows
 
 		if any(good_x != self.good_x):
 			total_nan_x = sum(good_x == False)
@@ -348,9 +405,13 @@ class DataInput(object):
 		self.nx    = len(self.x)
 		self.ny    = len(self.y)
 
+		# the kept rows/cols are generally non-contiguous here, so gather them
+		# with compress, which avoids materializing an index array the way
+		# boolean fancy-indexing does :
 		for i in list(self.data.keys()):
-			self.data[i] = self.data[i][self.good_y, :          ]
-			self.data[i] = self.data[i][:,           self.good_x]
+			self.data[i] = compress(self.good_y,
+			                        compress(self.good_x, self.data[i], axis=1),
+			                        axis=0)
 
 	def set_data_min(self, fn, boundary, val):
 		"""
@@ -371,6 +432,7 @@ class DataInput(object):
 		d                = self.data[fn]
 		d[d <= boundary] = val
 		self.data[fn]    = d
+		self.__invalidate_cache(fn)
 
 	def set_data_max(self, fn, boundary, val):
 		"""
@@ -391,6 +453,7 @@ class DataInput(object):
 		d                = self.data[fn]
 		d[d >= boundary] = val
 		self.data[fn]    = d
+		self.__invalidate_cache(fn)
 
 	def set_data_val(self, fn, old_val, new_val):
 		"""
@@ -411,6 +474,51 @@ class DataInput(object):
 		d                = self.data[fn]
 		d[d == old_val]  = new_val
 		self.data[fn]    = d
+		self.__invalidate_cache(fn)
+
+	def __invalidate_cache(self, fn=None):
+		"""
+		private method to drop cached interpolation objects.  If ``fn`` is given,
+		only the entries for that data field are removed; otherwise the entire
+		cache is cleared, e.g. after the grid coordinates themselves change.
+		"""
+		if fn is None:
+			self.spl_cache = {}
+		else:
+			for key in list(self.spl_cache.keys()):
+				if key[0] == fn:
+					del self.spl_cache[key]
+
+	def __get_spline(self, fn, order):
+		"""
+		private method returning a :class:`~scipy.interpolate.RectBivariateSpline`
+		over the data with key ``fn``, built once and cached within
+		``self.spl_cache`` so that repeated interpolations of the same field do
+		not re-fit the spline.
+		"""
+		key = (fn, order)
+		if key not in self.spl_cache:
+			self.spl_cache[key] = RectBivariateSpline(self.x, self.y,
+			                                          self.data[fn].T,
+			                                          kx=order, ky=order)
+		return self.spl_cache[key]
+
+	def __get_transform(self, p1, p2):
+		"""
+		private method returning a function mapping coordinates from projection
+		``p1`` to projection ``p2``.  With pyproj >= 2 this is the ``transform``
+		method of a :class:`~pyproj.Transformer` built once and cached within
+		``self.trans_cache``, avoiding the repeated PJ-object construction the
+		functional interface performs on every call.
+		"""
+		key = (p1.srs, p2.srs)
+		if key not in self.trans_cache:
+			if Transformer is not None:
+				self.trans_cache[key] = \
+					Transformer.from_proj(p1, p2, always_xy=True).transform
+			else:
+				self.trans_cache[key] = lambda x, y: transform(p1, p2, x, y)
+		return self.trans_cache[key]
 
 	def get_expression(self, fn, order=1, near=False):
 		"""
@@ -433,37 +541,113 @@ class DataInput(object):
 		data = self.data[fn]
 
 		if self.chg_proj:
-			new_proj = self.new_p
-			old_proj = self.proj
+			xform = self.__get_transform(self.new_p, self.proj)
 
 		if not near:
-			spline = RectBivariateSpline(self.x, self.y, data.T, kx=order, ky=order)
+			spline = self.__get_spline(fn, order)
 		else:
-			interp_x = interp1d(self.x, arange(len(self.x)), kind='nearest')
-			interp_y = interp1d(self.y, arange(len(self.y)), kind='nearest')
-
-		xs       = self.x
-		ys       = self.y
+			# the grid is uniform, so the nearest index is direct arithmetic :
+			dx = (self.x_max - self.x_min) / (self.nx - 1)
+			dy = (self.y_max - self.y_min) / (self.ny - 1)
+
+		x_min    = self.x_min
+		y_min    = self.y_min
+		nx       = self.nx
+		ny       = self.ny
 		chg_proj = self.chg_proj
 
+		# ``chg_proj`` and ``near`` are fixed for the life of the expression,
+		# so resolve the branches once here and bind the matching straight-line
+		# ``eval`` rather than re-testing both flags on every dof evaluation :
+		if not near:
+			def eval_interp(self, values, x):
+				values[0] = spline(x[0], x[1])
+			def eval_interp_proj(self, values, x):
+				xn, yn    = xform(x[0], x[1])
+				values[0] = spline(xn, yn)
+		else:
+			def eval_interp(self, values, x):
+				idx       = min(max(int(round((x[0] - x_min) / dx)), 0), nx - 1)
+				idy       = min(max(int(round((x[1] - y_min) / dy)), 0), ny - 1)
+				values[0] = data[idy, idx]
+			def eval_interp_proj(self, values, x):
+				xn, yn    = xform(x[0], x[1])
+				idx       = min(max(int(round((xn - x_min) / dx)), 0), nx - 1)
+				idy       = min(max(int(round((yn - y_min) / dy)), 0), ny - 1)
+				values[0] = data[idy, idx]
+
 		class CslvrExpression(Expression):
 			"""
 			Class that handles interpolation between altered projection coordinates.
 			"""
-			def eval(self, values, x):
-				if chg_proj:
-					xn, yn = transform(new_proj, old_proj, x[0], x[1])
-				else:
-					xn, yn = x[0], x[1]
-				if not near:
-					values[0] = spline(xn, yn)
-				else:
-					idx       = int(interp_x(xn))
-					idy       = int(interp_y(yn))
-					values[0] = data[idy, idx]
+			eval = eval_interp_proj if chg_proj else eval_interp
 
 		return CslvrExpression(element = self.element)
 
+	def get_interpolated_function(self, fn, order=1, near=False):
+		"""
+		Vectorized counterpart of
+		:func:`~inputoutput.DataInput.get_expression` which
+		interpolates the data with key ``fn`` directly onto the degrees of freedom
+		of a :class:`~dolfin.Function` built upon ``self.mesh``.  This avoids the
+		per-point ``eval`` calls made by :class:`~dolfin.Expression` objects; all
+		coordinates are projected with one call to :func:`~pyproj.transform` and
+		the entire batch is interpolated at once.
+
+		:param fn: key of data to interpolate
+		:param order: order of the interpolation
+		:param near:  use nearest-neighbor interpolation
+		:type fn: string
+		:type order: int
+		:type near: bool
+		:rtype: :class:`~dolfin.Function`
+		"""
+		if self.mesh is None:
+			s = ">>> get_interpolated_function() REQUIRES A MESH <<<"
+			print_text(s, 'red', 1)
+			sys.exit(1)
+
+		if near:  t = 'nearest-neighbor'
+		else:     t = 'O(%i) spline' % order
+		s = "::: getting '%s' %s function from '%s' :::" % (fn, t, self.name)
+		print_text(s, self.color)
+
+		data   = self.data[fn]
+
+		# the function space and physical coordinates of each of its dofs :
+		V      = FunctionSpace(self.mesh, self.element)
+		coords = V.tabulate_dof_coordinates().reshape(-1, self.dim)
+
+		# convert the projection of all the coordinates with one call :
+		if self.chg_proj:
+			xform  = self.__get_transform(self.new_p, self.proj)
+			xn, yn = xform(coords[:,0], coords[:,1])
+		else:
+			xn, yn = coords[:,0], coords[:,1]
+
+		# interpolate the entire batch of coordinates at once.  For linear and
+		# quadratic orders on this uniform grid, map_coordinates is much cheaper
+		# than fitting a spline :
+		if not near and order <= 2:
+			ix   = (xn - self.x_min) / (self.x_max - self.x_min) * (self.nx - 1)
+			iy   = (yn - self.y_min) / (self.y_max - self.y_min) * (self.ny - 1)
+			vals = map_coordinates(data, [iy, ix], order=order, mode='nearest')
+		elif not near:
+			spline = self.__get_spline(fn, order)
+			vals   = spline.ev(xn, yn)
+		else:
+			dx     = (self.x_max - self.x_min) / (self.nx - 1)
+			dy     = (self.y_max - self.y_min) / (self.ny - 1)
+			idx    = clip(rint((xn - self.x_min) / dx).astype(int), 0, self.nx - 1)
+			idy    = clip(rint((yn - self.y_min) / dy).astype(int), 0, self.ny - 1)
+			vals   = data[idy, idx]
+
+		# assign the values directly into the dof vector :
+		u = Function(V, name=fn)
+		u.vector().set_local(vals)
+		u.vector().apply('insert')
+		return u
+
 
 def print_min_max(u, title, color='97', cls=None):
 	"""
@@ -476,31 +660,55 @@ def print_min_max(u, title, color='97', cls=None):
 	:type title: string
 	:type color: string
 	"""
+	# the communicator is identical for every reduction below, so fetch the
+	# handle once per call rather than once per reduction :
+	comm = mpi_comm_world()
 	if isinstance(u, GenericVector):
-		uMin = MPI.min(mpi_comm_world(), u.min())
-		uMax = MPI.max(mpi_comm_world(), u.max())
+		uMin = MPI.min(comm, u.min())
+		uMax = MPI.max(comm, u.max())
 		s    = title + ' <min, max> : <%.3e, %.3e>' % (uMin, uMax)
 		print_text(s, color, cls=cls)
 	elif isinstance(u, indexed.Indexed):
-		dim = u.value_rank() + 1
+		dim  = u.value_rank() + 1
+		# materialize the dof vector once and view it component-wise, so a
+		# single pair of vectorized scans replaces 2*dim strided passes over
+		# fresh copies of the vector :
+		arr  = u.vector().get_local().reshape(-1, dim)
+		uMin = arr.min(axis=0)
+		uMax = arr.max(axis=0)
 		for i in range(u.value_rank()):
-			uMin = u.vector().array()[i : u.vector().size() : dim].min()
-			uMax = u.vector().array()[i : u.vector().size() : dim].max()
-			s    = title + '_%i <min, max> : <%.3e, %.3e>' % (i, uMin, uMax)
+			s    = title + '_%i <min, max> : <%.3e, %.3e>' % (i, uMin[i], uMax[i])
 			print_text(s, color, cls=cls)
 	elif isinstance(u, ndarray):
-		if u.dtype != float64:
-			u = u.astype(float64)
-		uMin = MPI.min(mpi_comm_world(), u.min())
-		uMax = MPI.max(mpi_comm_world(), u.max())
+		# min/max are exact in the native dtype, so only the two scalars need
+		# to be cast for the MPI reduction -- never the whole array :
+		uMin = MPI.min(comm, float(u.min()))
+		uMax = MPI.max(comm, float(u.max()))
 		s    = title + ' <min, max> : <%.3e, %.3e>' % (uMin, uMax)
 		print_text(s, color, cls=cls)
 	elif isinstance(u, Function):# \
 		#   or isinstance(u, dolfin.functions.function.Function):
-		uMin = MPI.min(mpi_comm_world(), u.vector().min())
-		uMax = MPI.max(mpi_comm_world(), u.vector().max())
-		s    = title + ' <min, max> : <%.3e, %.3e>' % (uMin, uMax)
-		print_text(s, color, cls=cls)
+		V   = u.function_space()
+		dim = V.num_sub_spaces()
+		# for mixed and vector functions, a single PETSc-to-NumPy copy serves
+		# every component rather than one traversal per sub-function; each
+		# component is read through its own dof map, which stays correct for
+		# unequal sub-elements (e.g. Taylor-Hood) where a plain reshape does
+		# not :
+		if dim > 0:
+			arr = u.vector().get_local()
+			off = V.dofmap().ownership_range()[0]
+			for i in range(dim):
+				arr_i  = arr[V.sub(i).dofmap().dofs() - off]
+				uMin_i = MPI.min(comm, float(arr_i.min()))
+				uMax_i = MPI.max(comm, float(arr_i.max()))
+				s    = title + '_%i <min, max> : <%.3e, %.3e>' % (i, uMin_i, uMax_i)
+				print_text(s, color, cls=cls)
+		else:
+			uMin = MPI.min(comm, u.vector().min())
+			uMax = MPI.max(comm, u.vector().max())
+			s    = title + ' <min, max> : <%.3e, %.3e>' % (uMin, uMax)
+			print_text(s, color, cls=cls)
 	elif isinstance(u, int) or isinstance(u, float):
 		s    = title + ' : %.3e' % u
 		print_text(s, color, cls=cls)
@@ -485,6 +485,9 @@ class LatModel(Model):
 		# mark the exterior facets and interior cells appropriately :
 		self.calculate_boundaries()
 
+		# the mesh has moved -- refresh the cell-diameter coefficient :
+		self.update_cell_diameter()
+
 	def calc_thickness(self):
 		"""
 		Calculate the continuous thickness field which increases from 0 at the
@@ -637,11 +640,11 @@ class LatModel(Model):
 		self.init_mask(1.0) # default to all grounded ice
 		self.init_E(1.0)    # always use no enhancement on rate-factor A
 
-		# Depth below sea level :
-		class Depth(Expression):
-			def eval(self, values, x):
-				values[0] = abs(min(0, x[1]))
-		self.D = Depth(element=self.Q.ufl_element())
+		# Depth below sea level.  A UFL conditional is inlined directly into
+		# every generated kernel that integrates it, where a Python callback
+		# re-enters the interpreter at each quadrature point :
+		x      = SpatialCoordinate(self.mesh)
+		self.D = conditional(lt(x[1], 0.0), -x[1], 0.0)
 
 
 
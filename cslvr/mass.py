@@ -8,6 +8,7 @@ from cslvr.d2model     import D2Model
 from cslvr.d3model     import D3Model
 from cslvr.helper      import VerticalBasis, VerticalFDBasis, \
                               VerticalIntegrator
+import numpy               as np
 import json
 
 
@@ -146,10 +147,13 @@ class UpperFreeSurface(Mass):
 
 		# dSdt mass matrix :
 		if self.lump_mass_matrix:
-			M         = assemble(action(dS * phi * dx, Constant(1)))  # row sums
-			M[M == 0] = 1.0
+			# row sums of the mass matrix; rows that lump to zero (vertex dofs
+			# of order-2 spaces) get a unit diagonal so they stay no-ops :
+			M_a        = assemble(action(dS * phi * dx, Constant(1))).get_local()
+			self.M_inv = 1.0 / np.where(M_a == 0.0, 1.0, M_a)
+			M          = None
 		else:
-			M         = assemble(dS * phi * dx)
+			M          = assemble(dS * phi * dx)
 
 		# theta-scheme (nu = 1/2 == Crank-Nicolson) :
 		nu          = 0.5
@@ -201,10 +205,13 @@ class UpperFreeSurface(Mass):
 		## solve the linear system :
 		#solve(lhs(self.delta_S) == rhs(self.delta_S), self.S, annotate=annotate)
 
-		# solve the non-linear system :
+		# solve the non-linear system -- the explicit quadrature degree keeps
+		# FFC's estimator from falling back to a very high order on the
+		# square-root source terms :
 		model.assign_variable(self.S_f, DOLFIN_EPS, annotate=annotate, cls=self)
 		solve(self.delta_S == 0, self.get_unknown(), J=self.mass_Jac,
-		      annotate=annotate, solver_parameters=self.solve_params['nparams'])
+		      annotate=annotate, solver_parameters=self.solve_params['nparams'],
+		      form_compiler_parameters=self.default_ffc_params())
 
 		# update the model surface :
 		self.update_model_var(self.get_unknown(), annotate=annotate)
@@ -222,8 +229,11 @@ class UpperFreeSurface(Mass):
 
 		model  = self.model
 
-		# assemple the stiffness matrix :
-		K = assemble(self.delta_dS)
+		# assemple the stiffness matrix into a persistent tensor :
+		if not hasattr(self, 'K_tensor'):
+			self.K_tensor = Vector()
+		K = assemble(self.delta_dS, tensor=self.K_tensor,
+		             form_compiler_parameters=self.default_ffc_params())
 
 		# add artificial diffusion to stiff. matrix in regions of high S gradients :
 		#if self.use_shock_capturing:
@@ -234,10 +244,15 @@ class UpperFreeSurface(Mass):
 
 		# calculate preliminary guess :
 		if self.lump_mass_matrix:
-			M_a             = self.M.get_local()
-			model.assign_variable(self.dSdt_f, K.get_local() / M_a, cls=self)
+			# the lumped reciprocal was formed once at initialization; each
+			# call is a single elementwise product, no solve at all :
+			model.assign_variable(self.dSdt_f, self.M_inv * K.get_local(), cls=self)
 		else:
-			solve(self.M, self.dSdt_f.vector(), K, annotate=annotate)
+			# the consistent mass matrix is constant, so it is factored once
+			# and each call afterwards is a back-substitution :
+			if not hasattr(self, 'M_solver'):
+				self.M_solver = LUSolver(self.M)
+			self.M_solver.solve(self.dSdt_f.vector(), K, annotate=annotate)
 
 		model.assign_variable(model.dSdt, self.dSdt_f, annotate=annotate, cls=self)
 
@@ -365,10 +380,12 @@ class LowerFreeSurface(Mass):
 		## solve the linear system :
 		#solve(lhs(self.delta_S) == rhs(self.delta_S), self.S, annotate=annotate)
 
-		# solve the non-linear system :
+		# solve the non-linear system -- with an explicit quadrature degree as
+		# for the upper surface :
 		model.assign_variable(self.B, DOLFIN_EPS, annotate=annotate)
 		solve(self.delta_B == 0, self.B, J=self.mass_Jac,
-		      annotate=annotate, solver_parameters=self.solve_params['nparams'])
+		      annotate=annotate, solver_parameters=self.solve_params['nparams'],
+		      form_compiler_parameters=self.default_ffc_params())
 		model.assign_variable(model.B, self.B, annotate=annotate)
 
 		# assemple the stiffness and mass matrices :
@@ -627,6 +644,7 @@ class FirnMass(Mass):
 		model.assign_variable(model.m,   model.mp)
 		model.mesh.coordinates()[:,0][model.index] = model.z # update the mesh coor
 		model.mesh.bounding_box_tree().build(model.mesh)     # rebuild the mesh tree
+		model.update_cell_diameter()                         # mesh has moved
 
 
 
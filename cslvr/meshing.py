@@ -235,23 +235,20 @@ class MeshGenerator(object):
 		f.write("// Mesh spacing\n")
 		f.write("lc = " + str(lc) + ";\n\n")
 
+		# build each block as one string so that we perform a single write per
+		# block instead of one write and format call per row :
 		f.write("// Points\n")
-		for i in range(pts):
-			f.write("Point(" + str(i) + ") = {" + str(c[i,0]) + "," \
-			        + str(c[i,1]) + ",0,lc};\n")
+		f.write(''.join(["Point(%s) = {%s,%s,0,lc};\n" % (i, x, y)
+		                 for i, (x, y) in enumerate(zip(c[:,0], c[:,1]))]))
 
 		f.write("\n// Lines\n")
-		for i in range(pts-1):
-			f.write("Line(" + str(i) + ") = {" + str(i) + "," + str(i+1) + "};\n")
+		f.write(''.join(["Line(%s) = {%s,%s};\n" % (i, i, i+1)
+		                 for i in range(pts-1)]))
 		f.write("Line(" + str(pts-1) + ") = {" + str(pts-1) + "," \
 		        + str(0) + "};\n\n")
 
 		f.write("// Line loop\n")
-		loop = ""
-		loop += "{"
-		for i in range(pts-1):
-			loop += str(i) + ","
-		loop += str(pts-1) + "}"
+		loop = "{" + ",".join([str(i) for i in range(pts)]) + "}"
 		f.write("Line Loop(" + str(pts+1) + ") = " + loop + ";\n\n")
 
 		f.write("// Surface\n")
@@ -281,9 +278,9 @@ class MeshGenerator(object):
 		f.write('# Points Count Value\n')
 		f.write('%i 1\n' % (np.size(c[:,0]) + 1))
 		f.write('# X pos Y pos\n')
-		for i in range(np.size(c[:,0])):
-			f.write("%10.10f %10.10f\n" % (c[i,0], c[i,1]))
-		f.write("%10.10f %10.10f"     % (c[0,0], c[0,1]))  # write first once more
+		rows = ["%10.10f %10.10f\n" % (x, y) for x, y in zip(c[:,0], c[:,1])]
+		rows.append("%10.10f %10.10f" % (c[0,0], c[0,1]))  # write first once more
+		f.write(''.join(rows))
 		f.close()
 
 	def extrude(self, h, n_layers):
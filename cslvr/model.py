@@ -15,6 +15,36 @@ import matplotlib.pyplot  as plt
 import matplotlib         as mpl
 import sys, os, re, json
 
+try:
+	from numba              import njit, prange
+except ImportError:
+	njit = None
+
+
+if njit is not None:
+	@njit(parallel=True, cache=True)
+	def _beta_stats_kernel(X, bhat, include_squares, out):
+		"""
+		Fused evaluation of the statistical friction regression: for each dof
+		accumulate the bias, linear, and pairwise-product terms and apply the
+		exponential in one pass, without materializing the feature matrix.
+		"""
+		n_dof = X.shape[0]
+		n_f   = X.shape[1]
+		for v in prange(n_dof):
+			s = bhat[0]
+			k = 1
+			for i in range(n_f):
+				s += bhat[k] * X[v,i]
+				k += 1
+			for i in range(n_f):
+				if include_squares:  j0 = i
+				else:                j0 = i + 1
+				for j in range(j0, n_f):
+					s += bhat[k] * X[v,i] * X[v,j]
+					k += 1
+			out[v] = np.exp(s)**2
+
 
 
 
@@ -48,10 +78,13 @@ class Model(object):
 		print_text(s, cls=self.this)
 
 		parameters["std_out_all_processes"]               = False
-		#parameters['form_compiler']['optimize']           = True
-		#parameters['form_compiler']['cpp_optimize']       = True
-		#parameters['form_compiler']['cpp_optimize_flags'] = "-O3"
-		#parameters["form_compiler"]["representation"]     = 'uflacs'
+		# optimized kernels for every form -- also those assembled outside a
+		# Physics instance, e.g. project() calls -- matching the parameters
+		# the physics classes pass explicitly :
+		parameters['form_compiler']['optimize']           = True
+		parameters['form_compiler']['cpp_optimize']       = True
+		parameters['form_compiler']['cpp_optimize_flags'] = "-O3"
+		parameters["form_compiler"]["representation"]     = 'uflacs'
 		#PETScOptions.set("mat_mumps_icntl_14", 100.0)
 
 		self.order        = order                        # order of basis
@@ -654,6 +687,8 @@ class Model(object):
 		s = "::: initializing pressure-adjusted temperature :::"
 		print_text(s, cls=self.this)
 		self.assign_variable(self.Tp, Tp)
+		if self.energy_dependent_rate_factor:
+			self.update_energy_dependent_rate_factor()
 
 	def init_W(self, W):
 		r"""
@@ -665,6 +700,8 @@ class Model(object):
 		s = "::: initializing water content :::"
 		print_text(s, cls=self.this)
 		self.assign_variable(self.W, W)
+		if self.energy_dependent_rate_factor:
+			self.update_energy_dependent_rate_factor()
 
 	def init_Wc(self, Wc):
 		r"""
@@ -1439,7 +1476,19 @@ class Model(object):
 		Initialize the basal normal stress ``self.lam`` to cryostatic pressure
 		:math:`\rho g (S - B)`.
 		"""
-		p = project(self.rho_i * self.g * (self.S - self.B), self.Q)
+		p   = Function(self.Q, name='p_cryostatic')
+		if self.use_periodic:
+			# S and B live on the non-periodic space, whose dof layout differs
+			# from the periodic Q -- map through a projection :
+			p.assign(self.cached_projection(self.rho_i*self.g*(self.S - self.B)))
+		else:
+			# S and B share the function space of lam, so the pressure is
+			# direct per-dof arithmetic; a project() here would assemble and
+			# solve a global mass-matrix system just to copy scaled dof
+			# values :
+			p_v = self.rho_i(0) * self.g(0) \
+			      * (self.S.vector().get_local() - self.B.vector().get_local())
+			self.assign_variable(p, p_v)
 		self.init_lam(p)
 
 	def init_beta_SIA(self, u_mag=None, eps=0.5):
@@ -1485,10 +1534,15 @@ class Model(object):
 		U_v[U_v < eps] = eps
 		self.assign_variable(U_s, U_v)
 		S_mag    = sqrt(inner(gradS, gradS) + DOLFIN_EPS)
-		beta_0   = project((rho_i*g*H*S_mag) / U_s, Q,
-		                   solver_type='iterative',
-		                   annotate=False)
-		beta_0_v = beta_0.vector().get_local()
+		# lumped-mass projection of the driving-stress ratio -- the row sums
+		# of the mass matrix reduce the projection to a pointwise divide,
+		# which is plenty accurate for an initialization heuristic.  rows
+		# that lump to zero or below (vertex dofs of order-2 spaces) get a
+		# unit diagonal so they stay no-ops :
+		phi      = TestFunction(Q)
+		M_l      = assemble(Constant(1.0) * phi * dx).get_local()
+		beta_0_v = assemble((rho_i*g*H*S_mag) / U_s * phi * dx).get_local()
+		beta_0_v /= np.where(M_l <= 0.0, 1.0, M_l)
 		beta_0_v[beta_0_v < 1e-2] = 1e-2
 		self.betaSIA = Function(Q, name='betaSIA')
 		self.assign_variable(self.betaSIA, beta_0_v)
@@ -1509,98 +1563,14 @@ class Model(object):
 		s    = "::: initializing beta from stats :::"
 		print_text(s, cls=self.this)
 
-		q_geo  = self.q_geo
-		T_s    = self.T_surface
-		S_ring = self.S_ring
-		Mb     = self.Mb
+		# clamp the dof values of u_bar away from zero for the logarithm :
 		u_bar   = self.u_bar
-		Q      = self.Q
-		B      = self.B
-		S      = self.S
-		T      = self.T
-		T_s    = self.T_surface
-		rho    = self.rho_i
-		g      = self.g
-		H      = S - B
-
 		u_bar_v = u_bar.vector().get_local()
 		u_bar_v[u_bar_v < 1e-10] = 1e-10
 		self.assign_variable(u_bar, u_bar_v)
 
-		D      = Function(Q, name='D')
-		B_v    = B.vector().get_local()
-		D_v    = D.vector().get_local()
-		D_v[B_v < 0] = B_v[B_v < 0]
-		self.assign_variable(D, D_v)
-
-		gradS = as_vector([S.dx(0), S.dx(1), 0.0])
-		gradB = as_vector([B.dx(0), B.dx(1), 0.0])
-		gradH = as_vector([H.dx(0), H.dx(1), 0.0])
-
-		nS   = sqrt(inner(gradS, gradS) + DOLFIN_EPS)
-		nB   = sqrt(inner(gradB, gradB) + DOLFIN_EPS)
-		nH   = sqrt(inner(gradH, gradH) + DOLFIN_EPS)
-
-		#if mdl == 'u_bar':
-		#  u_x    = -rho * g * H * S.dx(0)
-		#  v_x    = -rho * g * H * S.dx(1)
-		#  U_i    = as_vector([u_x,  v_x, 0.0])
-		#  U_j    = as_vector([v_x, -u_x, 0.0])
-		#elif mdl == 'U' or mdl == 'U_u_bar':
-		#  U_i    = as_vector([self.u_x,  self.u_y, 0.0])
-		#  U_j    = as_vector([self.u_y, -self.u_x, 0.0])
-		U_i    = as_vector([self.u_x,  self.u_y, 0.0])
-		U_j    = as_vector([self.u_y, -self.u_x, 0.0])
-		Umag   = sqrt(inner(U_i,U_i) + DOLFIN_EPS)
-		Uhat_i = U_i / Umag
-		Uhat_j = U_j / Umag
-
-		dBdi = dot(gradB, Uhat_i)
-		dBdj = dot(gradB, Uhat_j)
-		dSdi = dot(gradS, Uhat_i)
-		dSdj = dot(gradS, Uhat_j)
-		dHdi = dot(gradH, Uhat_i)
-		dHdj = dot(gradH, Uhat_j)
-
-		ini  = sqrt(rho * g * H * nS / (Umag + 0.1))
-
-		x0   = S
-		x1   = T_s
-		x2   = nS
-		x3   = D
-		x4   = nB
-		x5   = H
-		x6   = q_geo
-		x7   = S_ring
-		x8   = T
-		x9   = Mb
-		x10  = self.u_x
-		x11  = self.u_y
-		x12  = self.u_z
-		x13  = ln(u_bar + DOLFIN_EPS)
-		x14  = ln(Umag + DOLFIN_EPS)
-		x15  = ini
-		x16  = dBdi
-		x17  = dBdj
-		x18  = dSdi
-		x19  = dSdj
-		x20  = nH
-		x21  = self.tau_id
-		x22  = self.tau_jd
-		x23  = self.tau_ii
-		x24  = self.tau_ij
-		x25  = self.tau_ji
-		x26  = self.tau_jj
-
-		names = ['S', 'T_s', 'gradS', 'D', 'gradB', 'H', 'q_geo', 'S_ring', 'T',
-		         'Mb', 'u', 'v', 'w', 'ln(u_bar)', 'ln(Umag)', 'ini',
-		         'dBdi', 'dBdj', 'dSdi', 'dSdj', 'nablaH', 'tau_id', 'tau_jd',
-		         'tau_ii', 'tau_ij', 'tau_ji', 'tau_jj']
-		names = np.array(names)
-
 		if mdl == 'u_bar':
 			if not use_temp:
-				X    = [x0,x1,x5,x7,x13,x16,x18]
 				idx  = [ 0, 1, 5, 7, 13, 16, 18]
 				bhat = [ -1.01661102e+02,   6.59472291e-03,   8.34479667e-01,
 				         -3.20751595e-04,  -1.86910058e+00,  -1.50122785e-01,
@@ -1628,7 +1598,6 @@ class Model(object):
 				#         -1.35364012e+01,   2.01047113e+01,  -3.48057200e+01]
 
 			else:
-				X    = [x0,x1,x5,x7,x8,x9,x13,x16,x18]
 				idx  = [ 0, 1, 5, 7, 8, 9, 13, 16, 18]
 				bhat = [  1.99093750e+01,  -9.37152784e-04,  -1.53849816e-03,
 				         -2.72682710e-03,   3.11376629e+00,  -6.22550705e-02,
@@ -1649,7 +1618,6 @@ class Model(object):
 
 		elif mdl == 'U':
 			if not use_temp:
-				X    = [x0,x1,x5,x7,x14,x16,x18]
 				idx  = [ 0, 1, 5, 7, 14, 16, 18]
 				bhat = [ -9.28289389e+01,   5.73687339e-03,   7.33526290e-01,
 				          2.76998568e-03,  -1.08656857e-01,  -1.08545047e+00,
@@ -1664,7 +1632,6 @@ class Model(object):
 				         -2.62000881e-02,  -1.78157283e-02,   7.19763432e-02,
 				         -1.94919730e+00,  -9.82413027e+00,  -7.61245200e+01]
 			else:
-				X    = [x0,x1,x5,x7,x8,x9,x14,x16,x18]
 				idx  = [ 0, 1, 5, 7, 8, 9, 14, 16, 18]
 				bhat = [  2.09623581e+01,   6.66919839e-04,  -7.02196170e-02,
 				         -1.15080308e-03,   5.34783070e+00,  -7.11388758e-02,
@@ -1685,7 +1652,6 @@ class Model(object):
 
 		elif mdl == 'U_u_bar':
 			if not use_temp:
-				X    = [x0,x1,x5,x7,x13,x14,x16,x18]
 				idx  = [ 0, 1, 5, 7, 13, 14, 16, 18]
 				bhat = [ -9.25221622e+01,   5.70295987e-03,   7.30768422e-01,
 				          2.75877006e-03,   7.37861453e-02,  -2.93985236e-03,
@@ -1703,7 +1669,6 @@ class Model(object):
 				         -2.83133687e-02,  -3.08127082e-02,  -3.19074160e-02,
 				         -1.60977763e+00,  -1.10451113e+01,  -7.66011531e+01]
 			else:
-				X    = [x0,x1,x5,x7,x8,x9,x13,x14,x16,x18]
 				idx  = [ 0, 1, 5, 7, 8, 9, 13, 14, 16, 18]
 				bhat = [  1.95228446e+01,   6.59477606e-04,  -6.45139002e-02,
 				         -1.10071394e-03,   5.13699019e+00,  -6.45652015e-02,
@@ -1726,7 +1691,6 @@ class Model(object):
 				          2.54399352e+00,  -4.21129483e+01]
 
 		elif mdl == 'stress':
-			X    = [x0,x1,x5,x7,x14,x16,x18,x21,x23,x24,x25,x26]
 			idx  = [ 0, 1, 5, 7, 14, 16, 18, 21, 23, 24, 25, 26]
 			bhat = [  5.47574225e+00,   9.14001489e-04,  -1.03229081e-03,
 			         -7.04987042e-04,   2.15686223e+00,  -1.52869679e+00,
@@ -1756,47 +1720,152 @@ class Model(object):
 			         -4.87322338e-14,   9.62949381e-14,  -2.12122129e-13,
 			          1.55871983e-13]
 
+		# stash the regression configuration so that update_stats_beta() can
+		# re-evaluate it against the current fields :
+		self.beta_stats_mdl      = mdl
+		self.beta_stats_use_temp = use_temp
+		self.beta_stats_idx      = idx
+		self.beta_stats_bhat     = np.array(bhat)
+
+		beta_v = self.eval_beta_stats()
+
+		if mode == 'steady':
+			beta_v[beta_v < DOLFIN_EPS] = DOLFIN_EPS
+			self.init_beta(beta_v)
+		elif mode == 'transient':
+			self.assign_variable(self.beta, 200.0)
+
+		print_min_max(self.beta, 'beta_hat', cls=self)
+
+	def eval_beta_stats(self):
+		"""
+		Evaluate the statistical friction regression configured by
+		:func:`init_beta_stats` against the current model fields and return
+		the resulting :math:`\\beta` dof vector.
+
+		The regression is evaluated at the dof values directly: the features
+		are stacked column-wise into one dense matrix and contracted against
+		the coefficient vector with a single matrix-vector product, rather
+		than forming and projecting the equivalent UFL expression tree.
+		"""
+		mdl      = self.beta_stats_mdl
+		use_temp = self.beta_stats_use_temp
+		idx      = self.beta_stats_idx
+		bhat     = self.beta_stats_bhat
+		Q        = self.Q
+
+		# algebraic features come straight off the dof vectors.  S and B are
+		# declared on the non-periodic space, so under periodic boundaries
+		# they are first mapped onto Q so every feature shares one layout :
+		if self.use_periodic:
+			S_v    = self.cached_projection(self.S).vector().get_local()
+			B_v    = self.cached_projection(self.B).vector().get_local()
+		else:
+			S_v    = self.S.vector().get_local()
+			B_v    = self.B.vector().get_local()
+		H_v      = S_v - B_v
+		T_s_v    = self.T_surface.vector().get_local()
+		S_ring_v = self.S_ring.vector().get_local()
+		u_bar_v  = self.u_bar.vector().get_local()
+		u_v      = self.u_x.vector().get_local()
+		v_v      = self.u_y.vector().get_local()
+		Umag_v   = np.hypot(u_v, v_v)
+		Umag_v  += DOLFIN_EPS
+
+		# the derivative-based features require a mass-matrix solve each; the
+		# cached projection factors the matrix only once, so each feature (and
+		# every later re-evaluation) costs an RHS assembly plus a
+		# back-substitution :
+		U_i    = as_vector([self.u_x,  self.u_y, 0.0])
+		Umag   = sqrt(inner(U_i,U_i) + DOLFIN_EPS)
+		Uhat_i = U_i / Umag
+		gradS  = as_vector([self.S.dx(0), self.S.dx(1), 0.0])
+		gradB  = as_vector([self.B.dx(0), self.B.dx(1), 0.0])
+		dBdi_v = self.cached_projection(dot(gradB, Uhat_i)).vector().get_local()
+		dSdi_v = self.cached_projection(dot(gradS, Uhat_i)).vector().get_local()
+
+		# the logarithms re-use the local copies in place; ``u_bar_v`` and
+		# ``Umag_v`` are not referenced again below :
+		u_bar_v += DOLFIN_EPS
+		np.log(u_bar_v, out=u_bar_v)
+		np.log(Umag_v,  out=Umag_v)
+
+		x0   = S_v
+		x1   = T_s_v
+		x5   = H_v
+		x7   = S_ring_v
+		x13  = u_bar_v
+		x14  = Umag_v
+		x16  = dBdi_v
+		x18  = dSdi_v
+
+		if mdl == 'u_bar':
+			if not use_temp:
+				X = [x0,x1,x5,x7,x13,x16,x18]
+			else:
+				x8  = self.T.vector().get_local()
+				x9  = self.Mb.vector().get_local()
+				X = [x0,x1,x5,x7,x8,x9,x13,x16,x18]
+		elif mdl == 'U':
+			if not use_temp:
+				X = [x0,x1,x5,x7,x14,x16,x18]
+			else:
+				x8  = self.T.vector().get_local()
+				x9  = self.Mb.vector().get_local()
+				X = [x0,x1,x5,x7,x8,x9,x14,x16,x18]
+		elif mdl == 'U_u_bar':
+			if not use_temp:
+				X = [x0,x1,x5,x7,x13,x14,x16,x18]
+			else:
+				x8  = self.T.vector().get_local()
+				x9  = self.Mb.vector().get_local()
+				X = [x0,x1,x5,x7,x8,x9,x13,x14,x16,x18]
+		elif mdl == 'stress':
+			x21 = self.tau_id.vector().get_local()
+			x23 = self.tau_ii.vector().get_local()
+			x24 = self.tau_ij.vector().get_local()
+			x25 = self.tau_ji.vector().get_local()
+			x26 = self.tau_jj.vector().get_local()
+			X = [x0,x1,x5,x7,x14,x16,x18,x21,x23,x24,x25,x26]
+
+		names = ['S', 'T_s', 'gradS', 'D', 'gradB', 'H', 'q_geo', 'S_ring', 'T',
+		         'Mb', 'u', 'v', 'w', 'ln(u_bar)', 'ln(Umag)', 'ini',
+		         'dBdi', 'dBdj', 'dSdi', 'dSdj', 'nablaH', 'tau_id', 'tau_jd',
+		         'tau_ii', 'tau_ij', 'tau_ji', 'tau_jj']
+		names = np.array(names)
+
 		for xx,nam in zip(X, names[idx]):
 			print_min_max(xx, nam, cls=self)
 
-		X_i  = []
-		X_i.extend(X)
-
+		include_squares = mdl == 'u_bar' or mdl == 'U' and not use_temp
+
+		# when numba is available, fuse the feature products, the contraction,
+		# and the exponential into one parallel pass over the dof vectors :
+		if njit is not None:
+			Xm  = np.column_stack(X)
+			out = np.empty(Xm.shape[0])
+			_beta_stats_kernel(Xm, bhat, include_squares, out)
+			return out
+
+		# otherwise one dense feature matrix and one BLAS matrix-vector
+		# product replace the quadratic-feature UFL sum; the column ordering
+		# mirrors the original nested loop so ``bhat`` lines up :
+		F      = np.empty((len(x0), len(bhat)))
+		F[:,0] = 1.0
+		col    = 1
+		for xx in X:
+			F[:,col] = xx
+			col += 1
 		for i,xx in enumerate(X):
-			if mdl == 'u_bar' or mdl == 'U' and not use_temp:
+			if include_squares:
 				k = i
 			else:
 				k = i+1
 			for yy in X[k:]:
-				X_i.append(xx*yy)
-
-		#self.beta_f = exp(Constant(bhat[0]))
-		self.beta_f = Constant(bhat[0])
-
-		for xx,bb in zip(X_i, bhat[1:]):
-			self.beta_f += Constant(bb)*xx
-			#self.beta_f *= exp(Constant(bb)*xx)
-		self.beta_f = exp(self.beta_f)**2
-
-		#if mode == 'steady':
-		#  beta0                   = project(self.beta_f, Q, annotate=False)
-		#  beta0_v                 = beta0.vector().get_local()
-		#  beta0_v[beta0_v < 1e-2] = 1e-2
-		#  self.assign_variable(beta0, beta0_v)
-		#
-		#  self.assign_variable(self.beta, 1e-2)
-		#  bc_beta = DirichletBC(self.Q, beta0, self.ff, self.GAMMA_B_GND)
-		#  bc_beta.apply(self.beta.vector())
-
-		if mode == 'steady':
-			beta0  = project(self.beta_f, Q, annotate=False)
-			beta0_v                 = beta0.vector().get_local()
-			beta0_v[beta0_v < DOLFIN_EPS] = DOLFIN_EPS
-			self.init_beta(beta0_v)
-		elif mode == 'transient':
-			self.assign_variable(self.beta, 200.0)
+				F[:,col] = xx * yy
+				col += 1
 
-		print_min_max(self.beta, 'beta_hat', cls=self)
+		return np.exp(F.dot(bhat))**2
 
 	def update_stats_beta(self):
 		"""
@@ -1804,11 +1873,10 @@ class Model(object):
 		"""
 		s    = "::: updating statistical beta :::"
 		print_text(s, self.D3Model_color)
-		beta   = project(self.beta_f, self.Q, annotate=False)
-		beta_v = beta.vector().get_local()
+		beta_v = self.eval_beta_stats()
 		##betaSIA_v = self.betaSIA.vector().get_local()
 		##beta_v[beta_v < 10.0]   = betaSIA_v[beta_v < 10.0]
-		beta_v[beta_v < 0.0]    = 0.0
+		np.maximum(beta_v, 0.0, out=beta_v)
 		#beta_v[beta_v > 2500.0] = 2500.0
 		self.assign_variable(self.beta, beta_v)
 
@@ -1848,15 +1916,30 @@ class Model(object):
 		print_text(s, cls=self.this)
 
 		self.energy_dependent_rate_factor = True
-
-		Tp          = self.Tp
-		W           = self.W
-		R           = self.R
-		E           = self.E
-		a_T         = conditional( lt(Tp, 263.15),  self.a_T_l, self.a_T_u)
-		Q_T         = conditional( lt(Tp, 263.15),  self.Q_T_l, self.Q_T_u)
-		W_T         = conditional( lt(W,  0.01),    W,          0.01)
-		self.A      = E*a_T*(1 + 181.25*W_T)*exp(-Q_T/(R*Tp))
+		self.update_energy_dependent_rate_factor()
+
+	def update_energy_dependent_rate_factor(self):
+		r"""
+		Re-evaluate the energy-dependent rate factor ``self.A`` at the dof
+		values of ``self.Tp`` and ``self.W``.
+
+		The temperature and water-content branches are resolved once per dof
+		here, so ``self.A`` stays a coefficient :class:`~fenics.Function` and
+		the momentum integration kernels are free of the per-quadrature-point
+		conditionals and exponential.  Call this after every update of the
+		energy state, e.g. from
+		:func:`~energy.Energy.partition_energy`.
+		"""
+		Tp_v   = self.Tp.vector().get_local()
+		W_v    = self.W.vector().get_local()
+		E_v    = self.E.vector().get_local()
+		R      = self.R(0)
+		cold   = Tp_v < 263.15
+		a_T_v  = np.where(cold, self.a_T_l(0), self.a_T_u(0))
+		Q_T_v  = np.where(cold, self.Q_T_l(0), self.Q_T_u(0))
+		W_T_v  = np.minimum(W_v, 0.01)
+		A_v    = E_v * a_T_v * (1 + 181.25*W_T_v) * np.exp(-Q_T_v/(R*Tp_v))
+		self.init_A(A_v)
 
 	def calc_eta(self, epsdot):
 		r"""
@@ -1879,9 +1962,11 @@ class Model(object):
 		A       = self.A
 		n       = self.n
 
-		# calculate viscosity :
+		# calculate viscosity, evaluated into the declared coefficient so that
+		# downstream forms tabulate nodal values rather than computing the
+		# power law at every quadrature point :
 		eta     = 0.5 * A**(-1/n) * (epsdot + eps_reg)**((1-n)/(2*n))
-		self.eta = eta
+		self.init_eta(self.cached_projection(eta))
 
 	def calc_vert_average(self, u):
 		"""
@@ -1982,11 +2067,11 @@ class Model(object):
 		:param U: horizontal velocity vector :math:`\underline{u}_h = [u\ v]^\intercal`
 		:rtype:  :class:`~dolfin.Function` of angle values.
 		"""
-		u,v,w   = U.split(True)
-		u_v     = u.vector().get_local()
-		v_v     = v.vector().get_local()
-		theta_v = np.arctan2(v_v, u_v)
-		Q       = u.function_space()
+		# one copy of the parent dof vector provides every component; the
+		# deep-copy split() would allocate three new Functions just to be read :
+		U_v     = U.vector().get_local().reshape(-1, 3)
+		theta_v = np.arctan2(U_v[:,1], U_v[:,0])
+		Q       = U.function_space().sub(0).collapse()
 		theta   = Function(Q, name='theta_xy_U_angle')
 		self.assign_variable(theta, theta_v)
 		return theta
@@ -1999,10 +2084,10 @@ class Model(object):
 		:param U: vertical velocity vector :math:`\underline{u}_v = [u\ w]^\intercal`
 		:rtype:  :class:`~dolfin.Function` of angle values.
 		"""
-		u,v,w   = self.u_x.split(True)
-		u_v     = u.vector().get_local()
-		w_v     = w.vector().get_local()
-		theta_v = np.arctan2(w_v, u_v)
+		# as in get_xy_velocity_angle, read the components from one copy of the
+		# parent dof vector rather than deep-copy splitting :
+		U_v     = self.u_x.vector().get_local().reshape(-1, 3)
+		theta_v = np.arctan2(U_v[:,2], U_v[:,0])
 		theta   = Function(self.Q, name='theta_xz_U_angle')
 		self.assign_variable(theta, theta_v)
 		return theta
@@ -2220,6 +2305,46 @@ class Model(object):
 			u = var
 		print_min_max(u, u.name(), cls=cls)
 
+	def update_cell_diameter(self):
+		"""
+		(Re)compute the cellwise-constant cell-diameter coefficient ``self.h``
+		from the current mesh coordinates.  This must be called again after
+		any operation that moves the mesh, such as
+		:func:`~d3model.D3Model.deform_mesh_to_geometry`.
+		"""
+		s = "::: updating cell diameter :::"
+		print_text(s, cls=self.this)
+		DG0    = self.h.function_space()
+		h_v    = self.h.vector().get_local()
+		dofmap = DG0.dofmap()
+		for c in cells(self.mesh):
+			h_v[dofmap.cell_dofs(c.index())[0]] = c.h()
+		self.h.vector().set_local(h_v)
+		self.h.vector().apply('insert')
+
+	def cached_projection(self, expr, annotate=False):
+		"""
+		Project UFL expression ``expr`` onto ``self.Q`` re-using a cached
+		mass-matrix solver; the matrix is well-conditioned, so
+		Jacobi-preconditioned CG resolves each projection in a handful of
+		iterations beyond the right-hand-side assembly.
+
+		:param expr:     scalar UFL expression to project
+		:param annotate: allow Dolfin-Adjoint annotation
+		:type annotate:  bool
+		:rtype:          :class:`~dolfin.Function`
+		"""
+		if not hasattr(self, 'Q_mass_solver'):
+			phi    = TestFunction(self.Q)
+			solver = KrylovSolver('cg', 'jacobi')
+			solver.set_operator(assemble(TrialFunction(self.Q) * phi * dx))
+			self.Q_mass_solver = solver
+			self.Q_mass_phi    = phi
+		f = Function(self.Q)
+		self.Q_mass_solver.solve(f.vector(), assemble(expr*self.Q_mass_phi*dx),
+		                         annotate=annotate)
+		return f
+
 	def save_hdf5(self, u, f, name=None):
 		"""
 		Save a :class:`~dolfin.Function` ``u`` to the .h5 file ``f`` in the
@@ -2371,7 +2496,7 @@ class Model(object):
 		Coordinates of various types :
 
 		* ``self.x``   -- :class:`~dolfin.SpatialCoordinate` for ``self.mesh``
-		* ``self.h``   -- :class:`~dolfin.CellDiameter` for ``self.mesh``
+		* ``self.h``   -- cell diameter as a cellwise-constant :class:`~dolfin.Function`
 		* ``self.N``   -- :class:`~dolfin.FacetNormal` for ``self.mesh``
 		* ``self.lat`` -- latitude :class:`~dolfin.Function`
 		* ``self.lon`` -- longitude :class:`~dolfin.Function`
@@ -2488,8 +2613,15 @@ class Model(object):
 
 		# Coordinates of various types
 		self.x             = SpatialCoordinate(self.mesh)
-		self.h             = CellDiameter(self.mesh)
 		self.N             = FacetNormal(self.mesh)
+
+		# cell diameter, cached as a cellwise-constant coefficient so
+		# generated kernels read it with one load per cell rather than
+		# recomputing the geometry at every quadrature point; refreshed by
+		# update_cell_diameter() whenever the mesh moves :
+		self.h             = Function(FunctionSpace(self.mesh, 'DG', 0),
+		                              name='h')
+		self.update_cell_diameter()
 		self.lat           = Function(self.Q,  name='lat')
 		self.lon           = Function(self.Q,  name='lon')
 		self.n_s           = Function(self.V1, name='n_s')
@@ -2610,7 +2742,8 @@ class Model(object):
 	def home_rolled_newton_method(self, R, U, J, bcs, atol=1e-7, rtol=1e-10,
 	                              relaxation_param=1.0, max_iter=25,
 	                              method='mumps', preconditioner='default',
-	                              cb_ftn=None, bp_Jac=None, bp_R=None):
+	                              cb_ftn=None, bp_Jac=None, bp_R=None,
+	                              gamma_nt=0.2):
 		"""
 		Appy Newton's method.
 
@@ -2626,10 +2759,14 @@ class Model(object):
 		:param preconditioner:   preconditioning method to use with ``Krylov``
 		                         solver
 		:param cb_ftn:           at the end of each iteration, this is called
+		:param gamma_nt:         re-assemble the Jacobian only when the residual
+		                         contracted by less than this factor over the
+		                         previous iteration
 		"""
 		converged  = False
 		lmbda      = relaxation_param   # relaxation parameter
 		nIter      = 0                  # number of iterations
+		reassemble = True               # Jacobian assembly flag
 
 		## Set PETSc solve type (conjugate gradient) and preconditioner
 		## (algebraic multigrid)
@@ -2675,8 +2812,15 @@ class Model(object):
 
 		while not converged and nIter < max_iter:
 
-			# assemble system :
-			A, b    = assemble_system(J, -R, bcs_u)
+			# assemble system.  While the residual is contracting quickly the
+			# previous Jacobian still yields a good descent direction, so only the
+			# right-hand side is refreshed; skipping the Jacobian assembly roughly
+			# halves the cost of those iterations :
+			if reassemble:
+				A, b  = assemble_system(J, -R, bcs_u)
+			else:
+				b     = assemble(-R)
+				for bc in bcs_u:  bc.apply(b)
 
 			## Create Krylov solver and AMG preconditioner
 			#solver  = PETScKrylovSolver(method)#, preconditioner)
@@ -2707,6 +2851,11 @@ class Model(object):
 			# the relative residual :
 			rel_res = residual/residual_0
 
+			# decide whether the next iteration may re-use the Jacobian :
+			if nIter > 0:
+				reassemble = residual / residual_prev > gamma_nt
+			residual_prev = residual
+
 			# check for convergence :
 			converged = residual < atol or rel_res < rtol
 
@@ -6,7 +6,6 @@ from cslvr.helper           import raiseNotDefined
 from cslvr.inputoutput      import get_text, print_text, print_min_max
 from cslvr.physics          import Physics
 import numpy                    as np
-import matplotlib.pyplot        as plt
 import sys
 import os
 import json
@@ -156,6 +155,43 @@ class Momentum(Physics):
 		print_text("    - forming strain-rate tensor -", cls=self)
 		return 0.5 * (grad(u) + grad(u).T)
 
+	def get_rate_factor_coef(self):
+		r"""
+		Returns the flow-parameter coefficient :math:`A^{-\frac{1}{n}}` built
+		once and cached on this instance, so the viscosity and viscous
+		dissipation of a residual reference one shared UFL node -- including
+		the temperature conditionals inside the rate factor ``model.A`` --
+		rather than two copies of the same graph.
+		"""
+		if not hasattr(self, 'A_coef'):
+			n           = self.model.n
+			self.A_coef = self.model.A**(-1/n)
+		return self.A_coef
+
+	def get_strain_rate_base(self, linear=False):
+		r"""
+		Returns :math:`s = \left( \dot{\varepsilon}_e^2 + \dot{\varepsilon}_0 \right)^{\frac{1}{2n}}`
+		as a UFL variable cached on this instance.  Both
+		:func:`~momentum.Momentum.get_viscosity` and
+		:func:`~momentum.Momentum.get_viscous_dissipation` are expressed as
+		powers of this one shared symbol, so the generated assembly kernel
+		evaluates the expensive fractional power of the invariant once per
+		quadrature point rather than once per term.
+
+		If parameter ``linear == True``, the invariant is formed from the
+		velocity container ``self.model.u``; otherwise from the velocity
+		returned by :func:`~momentum.Momentum.get_velocity`.
+		"""
+		if not hasattr(self, 'srb_cache'):  self.srb_cache = {}
+		if linear not in self.srb_cache:
+			if linear:  u = self.model.u
+			else:       u = self.get_velocity()
+			n       = self.model.n
+			eps_reg = self.model.eps_reg
+			epsdot  = self.effective_strain_rate(u) + eps_reg
+			self.srb_cache[linear] = variable(epsdot**(1/(2*n)))
+		return self.srb_cache[linear]
+
 	def get_viscosity(self, linear=False):
 		r"""
 		calculates and returns the viscosity :math:`\eta` using velocity
@@ -174,15 +210,11 @@ class Momentum(Physics):
 		"""
 		if linear:
 			print_text("    - forming linear viscosity -",     cls=self)
-			u   = self.model.u
 		else:
 			print_text("    - forming non-linear viscosity -", cls=self)
-			u = self.get_velocity()
-		n       = self.model.n
-		A       = self.model.A
-		eps_reg = self.model.eps_reg
-		epsdot  = self.effective_strain_rate(u)
-		return 0.5 * A**(-1/n) * (epsdot + eps_reg)**((1-n)/(2*n))
+		n   = self.model.n
+		s_b = self.get_strain_rate_base(linear)
+		return 0.5 * self.get_rate_factor_coef() * s_b**(1-n)
 
 	def get_viscous_dissipation(self, linear=False):
 		r"""
@@ -208,17 +240,16 @@ class Momentum(Physics):
 		``self.model.u``.
 
 		"""
-		epsdot = self.effective_strain_rate(self.get_velocity())
 		if linear:
 			print_text("    - forming linear viscous dissipation -",     cls=self)
-			eta = self.get_viscosity(linear)
-			V   = 2 * eta * epsdot
+			epsdot = self.effective_strain_rate(self.get_velocity())
+			eta    = self.get_viscosity(linear)
+			V      = 2 * eta * epsdot
 		else:
 			print_text("    - forming non-linear viscous dissipation -", cls=self)
-			n        = self.model.n
-			A        = self.model.A
-			eps_reg  = self.model.eps_reg
-			V        = (2*n)/(n+1) * A**(-1/n) * (epsdot + eps_reg)**((n+1)/(2*n))
+			n      = self.model.n
+			s_b    = self.get_strain_rate_base(linear)
+			V      = (2*n)/(n+1) * self.get_rate_factor_coef() * s_b**(n+1)
 		return V
 
 	def deviatoric_stress_tensor(self, u, eta):
@@ -393,11 +424,18 @@ class Momentum(Physics):
 		s  = "::: solving adjoint momentum :::"
 		print_text(s, cls=self)
 
-		aw = assemble(lhs(dI))
-		Lw = assemble(rhs(dI))
-
-		a_solver = KrylovSolver('cg', 'hypre_amg')
-		a_solver.solve(aw, Lam.vector(), Lw, annotate=False)
+		# inside an optimization loop this is invoked once per iteration; the
+		# solver and tensors persist across calls so the Krylov setup is paid
+		# once and the previous adjoint warm-starts the next solve :
+		if not hasattr(self, 'adj_solver'):
+			self.adj_A      = Matrix()
+			self.adj_b      = Vector()
+			self.adj_solver = KrylovSolver('cg', 'hypre_amg')
+			self.adj_solver.parameters['nonzero_initial_guess'] = True
+		assemble(lhs(dI), tensor=self.adj_A)
+		assemble(rhs(dI), tensor=self.adj_b)
+		self.adj_solver.set_operator(self.adj_A)
+		self.adj_solver.solve(Lam.vector(), self.adj_b, annotate=False)
 
 		print_min_max(Lam, 'Lam')
 
@@ -241,13 +241,19 @@ class MomentumBPBase(Momentum):
 		self.model.assign_variable(self.u_z_b_f, u_z_b, cls=self, annotate=annotate)
 
 		model    = self.model
-		A        = assemble(lhs(self.u_z_F))
-		b        = assemble(rhs(self.u_z_F))
-		if len(self.u_z_bcs) > 0:
+
+		# the left-hand side is independent of the horizontal solution, so it
+		# is assembled and factored only once; each call afterwards pays only
+		# the right-hand-side assembly and a back-substitution :
+		if not hasattr(self, 'u_z_solver'):
+			A = assemble(lhs(self.u_z_F))
 			for bc in self.u_z_bcs:
-				bc.apply(A, b)
-		solver = LUSolver(self.solve_params['vert_solve_method'])
-		solver.solve(A, self.u_z.vector(), b, annotate=annotate)
+				bc.apply(A)
+			self.u_z_solver = LUSolver(A, self.solve_params['vert_solve_method'])
+		b = assemble(rhs(self.u_z_F))
+		for bc in self.u_z_bcs:
+			bc.apply(b)
+		self.u_z_solver.solve(self.u_z.vector(), b, annotate=annotate)
 
 		self.assz.assign(model.u.sub(2), self.u_z, annotate=annotate)
 		print_min_max(self.u_z, 'w')
@@ -332,10 +338,13 @@ class MomentumBP(MomentumBPBase):
 		dGamma_l   = model.dGamma_l()
 		dGamma_w   = model.dGamma_w()
 
-		# new constants :
-		p0     = 101325
-		T0     = 288.15
-		M      = 0.0289644
+		# new constants.  These are wrapped as ``Constant`` objects so the
+		# compiled form treats them as coefficients rather than baking the
+		# literals into its signature; changing one then never triggers a
+		# re-JIT of the form :
+		p0     = Constant(101325.0)   # standard atmospheric pressure
+		T0     = Constant(288.15)     # standard temperature
+		M      = Constant(0.0289644)  # molar mass of dry air
 		c_i    = model.c_i
 		p      = model.p
 		R      = model.R
@@ -374,11 +383,16 @@ class MomentumBP(MomentumBPBase):
 		        + beta * dot(u_h, v_h) * dGamma_b \
 		        - p_e * dot(n_h, v_h) * dGamma_bw
 
-		# apply water pressure if desired :
+		# apply water pressure if desired; the term is kept in the form with a
+		# constant multiplier so that toggling it does not change the form
+		# signature and force a fresh JIT compile :
 		if (not model.use_periodic and use_pressure_bc):
 			s = "    - using water pressure lateral boundary condition -"
 			print_text(s, cls=self)
-			resid -= p_e * dot(n_h, v_h) * dGamma_lt
+			self.pb_scale = Constant(1.0)
+		else:
+			self.pb_scale = Constant(0.0)
+		resid -= self.pb_scale * p_e * dot(n_h, v_h) * dGamma_lt
 
 		# add lateral boundary conditions :
 		# FIXME (maybe): need correct BP treatment here
@@ -445,10 +459,10 @@ class MomentumDukowiczBP(MomentumBPBase):
 		dGamma_lt  = model.dGamma_lt()
 		dGamma_l   = model.dGamma_l()
 
-		# new constants :
-		p0         = 101325
-		T0         = 288.15
-		M          = 0.0289644
+		# new constants (as Constants, to keep the form signature stable) :
+		p0         = Constant(101325.0)   # standard atmospheric pressure
+		T0         = Constant(288.15)     # standard temperature
+		M          = Constant(0.0289644)  # molar mass of dry air
 
 		#===========================================================================
 		# define variational problem :
@@ -480,10 +494,15 @@ class MomentumDukowiczBP(MomentumBPBase):
 		# action :
 		A      = (Vd - Pe)*dOmega - Sl*dGamma_b - Pb*dGamma_bw
 
+		# the lateral water-pressure term stays in the action with a constant
+		# multiplier so both configurations share one compiled form :
 		if (not model.use_periodic and use_pressure_bc):
 			s = "    - using water pressure lateral boundary condition -"
 			print_text(s, cls=self)
-			A -= Pb*dGamma_lt
+			self.pb_scale = Constant(1.0)
+		else:
+			self.pb_scale = Constant(0.0)
+		A -= self.pb_scale * Pb * dGamma_lt
 
 		# add lateral boundary conditions :
 		# FIXME: need correct BP treatment here
@@ -172,7 +172,7 @@ class MomentumFirn(Momentum):
 		self.asssig.assign(model.sigma, sigma)
 		self.assrss.assign(model.r,     r)
 
-		rhop = model.rho.vector().array()
+		rhop = model.rho.vector().get_local()
 
 		# update kc term in drhodt :
 		# if rho >  550, kc = kcHigh
@@ -249,6 +249,31 @@ class MomentumStokesBase(Momentum):
 		u_x, u_y, u_z, p = self.get_unknown()
 		return as_vector([u_x, u_y, u_z])
 
+	def default_solve_params(self):
+		"""
+		Returns a set of default solver parameters that yield good performance.
+		The inner linear systems are solved iteratively with GMRES; a direct
+		factorization of the 3D saddle-point matrix has fill-in that dominates
+		both memory and wall time beyond roughly :math:`10^5` dofs.
+		"""
+		nparams = {'newton_solver' :
+		          {
+		            'linear_solver'            : 'gmres',
+		            'preconditioner'           : 'hypre_amg',
+		            'relative_tolerance'       : 1e-9,
+		            'relaxation_parameter'     : 0.7,
+		            'maximum_iterations'       : 25,
+		            'error_on_nonconvergence'  : False,
+		            'krylov_solver'            :
+		            {
+		              'monitor_convergence'    : False,
+		              'nonzero_initial_guess'  : True,
+		              'relative_tolerance'     : 1e-6,
+		            }
+		          }}
+		m_params  = {'solver' : nparams}
+		return m_params
+
 	def picard_solve(self):
 		"""
 		"""
@@ -342,10 +367,10 @@ class MomentumDukowiczStokesReduced(MomentumBPBase):
 		dGamma_ltu = model.dGamma_ltu()
 		dGamma_lt  = model.dGamma_lt()
 
-		# new constants :
-		p0         = 101325
-		T0         = 288.15
-		M          = 0.0289644
+		# new constants (as Constants, to keep the form signature stable) :
+		p0         = Constant(101325.0)   # standard atmospheric pressure
+		T0         = Constant(288.15)     # standard temperature
+		M          = Constant(0.0289644)  # molar mass of dry air
 
 		#===========================================================================
 		# define variational problem :
@@ -384,10 +409,15 @@ class MomentumDukowiczStokesReduced(MomentumBPBase):
 		# action :
 		A      = (Vd - Pe)*dOmega - Sl_gnd*dGamma_bg - Pb*dGamma_bw
 
+		# keep the term in the action with a constant multiplier for a stable
+		# form signature :
 		if (not model.use_periodic and use_pressure_bc):
 			s = "    - using water pressure lateral boundary condition -"
 			print_text(s, cls=self)
-			A -= Pb*dGamma_lt
+			self.pb_scale = Constant(1.0)
+		else:
+			self.pb_scale = Constant(0.0)
+		A -= self.pb_scale * Pb * dGamma_lt
 
 		# add lateral boundary conditions :
 		# FIXME: need correct BP treatment here
@@ -586,10 +616,15 @@ class MomentumDukowiczStokes(MomentumStokesBase):
 		A      = + (Vd - Pe - Pc)*dOmega \
 		         - Nc*dGamma_b - Sl_gnd*dGamma_bg - Pb_w*dGamma_bw
 
+		# keep the term in the action with a constant multiplier for a stable
+		# form signature :
 		if (not model.use_periodic and use_pressure_bc):
 			s = "    - using water pressure lateral boundary condition -"
 			print_text(s, cls=self)
-			A -= Pb_w*dGamma_ltu
+			self.pb_scale = Constant(1.0)
+		else:
+			self.pb_scale = Constant(0.0)
+		A -= self.pb_scale * Pb_w * dGamma_ltu
 
 		if (not model.use_periodic and model.mark_divide and not use_lat_bcs):
 			s = "    - using internal divide lateral pressure boundary condition -"
@@ -666,10 +701,10 @@ class MomentumNitscheStokes(MomentumStokesBase):
 		dGamma_ld  = model.dGamma_ld()
 		dGamma_ltu = model.dGamma_ltu()
 
-		# new constants :
-		p0         = 101325
-		T0         = 288.15
-		M          = 0.0289644
+		# new constants (as Constants, to keep the form signature stable) :
+		p0         = Constant(101325.0)   # standard atmospheric pressure
+		T0         = Constant(288.15)     # standard temperature
+		M          = Constant(0.0289644)  # molar mass of dry air
 
 		#===========================================================================
 		# define variational problem :
@@ -720,10 +755,15 @@ class MomentumNitscheStokes(MomentumStokesBase):
 			tau    = Constant(1e-9) * h**2 / (2*eta + DOLFIN_EPS)
 			resid += inner(L(v,q), tau*(L(u,p) - f)) * dOmega
 
+		# keep the term in the residual with a constant multiplier for a stable
+		# form signature :
 		if (not model.use_periodic and use_pressure_bc):
 			s = "    - using water pressure lateral boundary condition -"
 			print_text(s, cls=self)
-			resid += Pb_w * dot(v,n) * dGamma_ltu
+			self.pb_scale = Constant(1.0)
+		else:
+			self.pb_scale = Constant(0.0)
+		resid += self.pb_scale * Pb_w * dot(v,n) * dGamma_ltu
 
 		if (not model.use_periodic and model.mark_divide and not use_lat_bcs):
 			s = "    - using internal divide lateral pressure boundary condition -"
@@ -786,10 +826,10 @@ class MomentumStokes(MomentumStokesBase):
 		dGamma_ld  = model.dGamma_ld()
 		dGamma_ltu = model.dGamma_ltu()
 
-		# new constants :
-		p0         = 101325
-		T0         = 288.15
-		M          = 0.0289644
+		# new constants (as Constants, to keep the form signature stable) :
+		p0         = Constant(101325.0)   # standard atmospheric pressure
+		T0         = Constant(288.15)     # standard temperature
+		M          = Constant(0.0289644)  # molar mass of dry air
 
 		#===========================================================================
 		# define variational problem :
@@ -847,10 +887,15 @@ class MomentumStokes(MomentumStokesBase):
 			self.f_stz  = inner(L(v,q), tau_stz*f) * dOmega
 			resid      += self.B_stz - self.f_stz
 
+		# keep the term in the residual with a constant multiplier for a stable
+		# form signature :
 		if (not model.use_periodic and use_pressure_bc):
 			s = "    - using water pressure lateral boundary condition -"
 			print_text(s, cls=self)
-			resid += Pb_w * dot(v,n) * dGamma_ltu
+			self.pb_scale = Constant(1.0)
+		else:
+			self.pb_scale = Constant(0.0)
+		resid += self.pb_scale * Pb_w * dot(v,n) * dGamma_ltu
 
 		if (not model.use_periodic and model.mark_divide and not use_lat_bcs):
 			s = "    - using internal divide lateral pressure boundary condition -"
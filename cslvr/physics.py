@@ -45,6 +45,23 @@ class Physics(object):
 		params  = {'solver' : 'mumps'}
 		return params
 
+	def default_ffc_params(self):
+		"""
+		Returns a set of default form-compiler parameters.  An explicit
+		quadrature degree is set because FFC's automatic estimator falls back
+		to a very high order on the fractional-exponent viscosity terms,
+		multiplying the number of quadrature points per cell for no gain in
+		accuracy with the low-order elements used here.
+
+		:rtype: dict
+		"""
+		ffc_params = {'representation'     : 'uflacs',
+		              'quadrature_degree'  : 4,
+		              'optimize'           : True,
+		              'cpp_optimize'       : True,
+		              'cpp_optimize_flags' : '-O3 -march=native -funroll-loops'}
+		return ffc_params
+
 	def get_solve_params(self):
 		"""
 		Returns the solve parameters.
@@ -65,6 +82,9 @@ class Physics(object):
 		"""
 		self.resid = resid
 
+		# any cached variational solver was built around the old residual :
+		if hasattr(self, 'var_solver'):  del self.var_solver
+
 		# if linear, separate the left- and right-hand sides :
 		if self.linear:
 			self.lhs = lhs(resid)
@@ -654,28 +674,84 @@ class Physics(object):
 		# solve linear system :
 		if self.linear:
 			print_text("::: solving linear equations :::", cls=self)
-			solve(self.get_lhs() == self.get_rhs(), \
-			      self.get_unknown(), \
-			      bcs               = self.get_boundary_conditions(), \
-			      annotate          = annotate, \
-			      solver_parameters = params['solver'])
+			if annotate:
+				# dolfin-adjoint must tape the full variational solve :
+				solve(self.get_lhs() == self.get_rhs(), \
+				      self.get_unknown(), \
+				      bcs                      = self.get_boundary_conditions(), \
+				      annotate                 = annotate, \
+				      solver_parameters        = params['solver'], \
+				      form_compiler_parameters = self.default_ffc_params())
+			else:
+				# assemble into persistent tensors so that the backend re-uses
+				# its sparsity pattern on every call after the first, and keep
+				# the solver object alive across calls -- e.g. each step of a
+				# transient or fixed-point loop -- rather than re-creating it :
+				if not hasattr(self, 'lin_solver'):
+					method = params['solver']
+					precon = 'none'
+					if isinstance(method, dict):
+						precon = method.get('preconditioner',  'none')
+						method = method.get('linear_solver',   'default')
+					self.lin_A      = Matrix()
+					self.lin_b      = Vector()
+					if has_krylov_solver_method(method):
+						self.lin_solver = KrylovSolver(method, precon)
+						# warm-start from the previous solution :
+						self.lin_solver.parameters['nonzero_initial_guess'] = True
+					else:
+						self.lin_solver = LUSolver(method)
+				assemble(self.get_lhs(), tensor=self.lin_A, \
+				         form_compiler_parameters = self.default_ffc_params())
+				assemble(self.get_rhs(), tensor=self.lin_b, \
+				         form_compiler_parameters = self.default_ffc_params())
+				for bc in self.get_boundary_conditions():
+					bc.apply(self.lin_A, self.lin_b)
+				self.lin_solver.set_operator(self.lin_A)
+				self.lin_solver.solve(self.get_unknown().vector(), self.lin_b, \
+				                      annotate=annotate)
 
 		# or solve non-linear system :
 		else:
-			rtol   = params['solver']['newton_solver']['relative_tolerance']
-			maxit  = params['solver']['newton_solver']['maximum_iterations']
-			alpha  = params['solver']['newton_solver']['relaxation_parameter']
-			s      = "::: solving nonlinear system with %i max iterations " + \
-			         "and step size = %.1f :::"
-			print_text(s % (maxit, alpha), cls=self)
+			# PETSc SNES is used whenever 'snes_solver' parameters are supplied;
+			# otherwise dolfin's own Newton solver :
+			use_snes = 'snes_solver' in params['solver']
+			if use_snes:
+				maxit  = params['solver']['snes_solver']['maximum_iterations']
+				s      = "::: solving nonlinear system via PETSc SNES with " + \
+				         "%i max iterations :::"
+				print_text(s % maxit, cls=self)
+			else:
+				maxit  = params['solver']['newton_solver']['maximum_iterations']
+				alpha  = params['solver']['newton_solver']['relaxation_parameter']
+				s      = "::: solving nonlinear system with %i max iterations " + \
+				         "and step size = %.1f :::"
+				print_text(s % (maxit, alpha), cls=self)
+
+			# the variational problem and its solver are built once and re-used
+			# for every subsequent solve -- e.g. each iteration of a transient or
+			# thermo-mechanically-coupled loop -- so the backend may retain its
+			# sparsity pattern, symbolic factorization, and preconditioner rather
+			# than re-creating them each call :
+			if not hasattr(self, 'var_solver'):
+				problem = NonlinearVariationalProblem( \
+				            self.get_residual(), \
+				            self.get_unknown(), \
+				            bcs = self.get_boundary_conditions(), \
+				            J   = self.get_jacobian(), \
+				            form_compiler_parameters = self.default_ffc_params())
+				self.var_solver = NonlinearVariationalSolver(problem)
+				if use_snes:
+					self.var_solver.parameters['nonlinear_solver'] = 'snes'
+					self.var_solver.parameters['snes_solver'].update( \
+					  params['solver']['snes_solver'])
+				else:
+					self.var_solver.parameters['nonlinear_solver'] = 'newton'
+					self.var_solver.parameters['newton_solver'].update( \
+					  params['solver']['newton_solver'])
 
 			# compute solution :
-			solve(self.get_residual() == 0, \
-			      self.get_unknown(), \
-			      J                 = self.get_jacobian(), \
-			      bcs               = self.get_boundary_conditions(), \
-			      annotate          = annotate, \
-			      solver_parameters = params['solver'])
+			self.var_solver.solve(annotate = annotate)
 
 		# calculate total time to compute
 		t_tot = time() - t0
@@ -83,8 +83,14 @@ class StressBalance(Physics):
 		u,v,w    = U.split(True)
 		U        = as_vector([u, v])
 		U_hat    = model.normalize_vector(U)
-		U_n      = as_vector([U_hat[0],  U_hat[1], 0.0])
-		U_t      = as_vector([U_hat[1], -U_hat[0], 0.0])
+
+		# lower the normalized flow direction to coefficient fields, so the
+		# nine balance forms read tabulated nodal values instead of
+		# re-evaluating the normalization at every quadrature point :
+		u_hat    = model.cached_projection(U_hat[0])
+		v_hat    = model.cached_projection(U_hat[1])
+		U_n      = as_vector([u_hat,  v_hat, 0.0])
+		U_t      = as_vector([v_hat, -u_hat, 0.0])
 		S        = model.S
 		B        = model.B
 
@@ -98,19 +104,39 @@ class StressBalance(Physics):
 		phi      = TestFunction(model.Q_non_periodic)
 		dtau     = TrialFunction(model.Q_non_periodic)
 
-		# mass matrix :
-		self.M = assemble(phi*dtau*dx)
-
-		# integrated stress-balance using Leibniz Theorem :
-		self.M_ii = (d_di(N_ii) + tau_ii_S*d_di(S) - tau_ii_B*d_di(B)) * phi * dx
-		self.M_ij = (d_dj(N_ij) + tau_ij_S*d_dj(S) - tau_ij_B*d_dj(B)) * phi * dx
-		self.M_iz = (tau_iz_S - tau_iz_B) * phi * dx
-		self.M_ji = (d_di(N_ji) + tau_ji_S*d_di(S) - tau_ji_B*d_di(B)) * phi * dx
-		self.M_jj = (d_dj(N_jj) + tau_jj_S*d_dj(S) - tau_jj_B*d_dj(B)) * phi * dx
-		self.M_jz = (tau_jz_S - tau_jz_B) * phi * dx
-		self.M_zi = (d_di(N_zi) + tau_zi_S*d_di(S) - tau_zi_B*d_di(B)) * phi * dx
-		self.M_zj = (d_dj(N_zj) + tau_zj_S*d_dj(S) - tau_zj_B*d_dj(B)) * phi * dx
-		self.M_zz = (tau_zz_S - tau_zz_B) * phi * dx
+		# the mass matrix is well-conditioned, so Jacobi-preconditioned CG
+		# converges in a handful of iterations -- far cheaper than an LU
+		# factorization for these component solves :
+		self.M        = assemble(phi*dtau*dx)
+		self.M_solver = KrylovSolver('cg', 'jacobi')
+		self.M_solver.set_operator(self.M)
+
+		# integrated stress-balance using Leibniz Theorem, with all nine
+		# component forms packed into a single vector-valued form so each
+		# solve traverses the mesh and tabulates the shared surface, basal,
+		# and membrane-stress coefficients once instead of nine times :
+		Qe        = model.Q_non_periodic.ufl_element()
+		W         = VectorFunctionSpace(model.mesh, Qe.family(), Qe.degree(),
+		                                dim=9)
+		Phi       = TestFunction(W)
+		self.tau_form = \
+		  + (d_di(N_ii) + tau_ii_S*d_di(S) - tau_ii_B*d_di(B)) * Phi[0] * dx \
+		  + (d_dj(N_ij) + tau_ij_S*d_dj(S) - tau_ij_B*d_dj(B)) * Phi[1] * dx \
+		  + (tau_iz_S - tau_iz_B) * Phi[2] * dx \
+		  + (d_di(N_ji) + tau_ji_S*d_di(S) - tau_ji_B*d_di(B)) * Phi[3] * dx \
+		  + (d_dj(N_jj) + tau_jj_S*d_dj(S) - tau_jj_B*d_dj(B)) * Phi[4] * dx \
+		  + (tau_jz_S - tau_jz_B) * Phi[5] * dx \
+		  + (d_di(N_zi) + tau_zi_S*d_di(S) - tau_zi_B*d_di(B)) * Phi[6] * dx \
+		  + (d_dj(N_zj) + tau_zj_S*d_dj(S) - tau_zj_B*d_dj(B)) * Phi[7] * dx \
+		  + (tau_zz_S - tau_zz_B) * Phi[8] * dx
+
+		# dof maps from each component of the packed right-hand side back to
+		# the scalar space, and a scratch vector for the back-substitutions.
+		# the sub-dofmaps hand back global indices, so shift them by the
+		# ownership offset to address the process-local assembled array :
+		off = W.dofmap().ownership_range()[0]
+		self.component_dofs = [W.sub(k).dofmap().dofs() - off for k in range(9)]
+		self.b_s            = Function(model.Q_non_periodic).vector()
 
 	def solve(self):
 		"""
@@ -120,25 +146,22 @@ class StressBalance(Physics):
 
 		model = self.model
 
-		# solve the linear system :
-		solve(self.M, model.M_ii.vector(), assemble(self.M_ii))
-		print_min_max(model.M_ii, 'M_ii')
-		solve(self.M, model.M_ij.vector(), assemble(self.M_ij))
-		print_min_max(model.M_ij, 'M_ij')
-		solve(self.M, model.M_iz.vector(), assemble(self.M_iz))
-		print_min_max(model.M_iz, 'M_iz')
-		solve(self.M, model.M_ji.vector(), assemble(self.M_ji))
-		print_min_max(model.M_ji, 'M_ji')
-		solve(self.M, model.M_jj.vector(), assemble(self.M_jj))
-		print_min_max(model.M_jj, 'M_jj')
-		solve(self.M, model.M_jz.vector(), assemble(self.M_jz))
-		print_min_max(model.M_jz, 'M_jz')
-		solve(self.M, model.M_zi.vector(), assemble(self.M_zi))
-		print_min_max(model.M_zi, 'm_zi')
-		solve(self.M, model.M_zj.vector(), assemble(self.M_zj))
-		print_min_max(model.M_zj, 'M_zj')
-		solve(self.M, model.M_zz.vector(), assemble(self.M_zz))
-		print_min_max(model.M_zz, 'M_zz')
+		# one assembly pass fills the right-hand sides of all nine
+		# components :
+		b_v    = assemble(self.tau_form).get_local()
+
+		fields = [(model.M_ii, 'M_ii'), (model.M_ij, 'M_ij'),
+		          (model.M_iz, 'M_iz'), (model.M_ji, 'M_ji'),
+		          (model.M_jj, 'M_jj'), (model.M_jz, 'M_jz'),
+		          (model.M_zi, 'm_zi'), (model.M_zj, 'M_zj'),
+		          (model.M_zz, 'M_zz')]
+
+		# solve each component, re-using the single factorization :
+		for dofs, (f, name) in zip(self.component_dofs, fields):
+			self.b_s.set_local(b_v[dofs])
+			self.b_s.apply('insert')
+			self.M_solver.solve(f.vector(), self.b_s)
+			print_min_max(f, name)
 
 
 
@@ -8,7 +8,6 @@ from cslvr.momentumstokes     import MomentumNitscheStokes, MomentumStokes, \
                                      MomentumDukowiczStokes
 from dolfin                   import Expression, interpolate, \
                                      as_vector, as_matrix
-import matplotlib.pyplot          as plt
 import sympy                      as sp
 import numpy                      as np
 